@@ -1,8 +1,7 @@
-from backend.config import get_settings
+from backend.config import settings
 from backend.main import app
 from backend.utils.logging_utils import logger
 
-settings = get_settings()
 
 if __name__ == '__main__':
     import uvicorn
@@ -11,4 +10,13 @@ if __name__ == '__main__':
     serv_port = settings.server_port
     logger.info("Server {}({}) started, running on http://{}:{}".format(
         settings.server_name, settings.server_env, serv_ip, serv_port))
-    uvicorn.run(app, host=serv_ip, port=serv_port)
+    # An import string is required for multiple workers; each worker process
+    # owns its own connection pool, so size MYSQL_POOL_MAX per worker
+    uvicorn.run(
+        "asgi:app",
+        host=serv_ip,
+        port=serv_port,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.server_workers or 1,
+    )
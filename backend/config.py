@@ -1,8 +1,6 @@
 """Configuration management for MySQL connection parameters."""
 
-from functools import lru_cache
-
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 """
 Configuration class for MySQL-Admin application.
@@ -15,6 +13,7 @@ class Settings(BaseSettings):
     server_env: str = "dev"
     server_ip: str = "127.0.0.1"
     server_port: int = 8000
+    server_workers: int = 1
 
     # MySQL connection parameters
     mysql_host: str = "localhost"
@@ -23,8 +22,38 @@ class Settings(BaseSettings):
     mysql_password: str = "123456"
 
     # Connection pool settings
-    mysql_pool_min: int = 1
-    mysql_pool_max: int = 10
+    mysql_pool_min: int = 5
+    mysql_pool_max: int = 25
+    mysql_pool_recycle: int = 3600  # seconds; -1 disables recycling
+    mysql_pool_acquire_timeout: float = 2.0  # seconds to wait for a free connection
+    # Separate pool with multi-statement support, used only for SQL scripts
+    # submitted through the query endpoint and for batched DDL export
+    mysql_script_pool_max: int = 2
+
+    # Insert batching: concurrent single-row inserts into the same table are
+    # combined into one multi-row INSERT (set max rows to 1 to disable)
+    insert_batch_wait_time: float = 0.05  # seconds
+    insert_batch_max_rows: int = 500
+
+    # Read-through cache for SELECT/SHOW results of the query endpoint
+    # (TTL of 0 disables caching)
+    query_cache_ttl: float = 5.0  # seconds
+    query_cache_max_entries: int = 256
+
+    # Column metadata (SHOW COLUMNS) reused by table data and structure
+    # requests; schema changes made through this API evict it immediately
+    # (TTL of 0 disables caching)
+    table_columns_cache_ttl: float = 60.0  # seconds
+
+    # Table data pages at least this large are streamed from a server-side
+    # cursor instead of being buffered in memory
+    table_data_stream_min_page_size: int = 200
+
+    # Fetch a table data page and its total in one query via COUNT(*) OVER ()
+    # (MySQL 8 / MariaDB 10.2+). The server builds every filtered row before
+    # applying LIMIT, so enable it only where it measures faster than the
+    # separate COUNT(*)
+    table_data_window_count: bool = False
 
     # Admin authentication
     admin_secret_key: str = "admin123"
@@ -35,14 +64,13 @@ class Settings(BaseSettings):
     logger_level: str = "INFO"
     logger_name: str = "mysql-admin"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    return Settings()
+# Process-wide settings instance, loaded once at import
+settings = Settings()
 
 
-settings = get_settings()
+def get_settings() -> Settings:
+    """Return the process-wide settings (kept for ``Depends`` and older callers)."""
+    return settings
@@ -1,11 +1,17 @@
 """Database connection manager for MySQL-Admin."""
-from typing import Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import aiomysql
+from pymysql.constants import CLIENT
 
 from backend.config import settings
 from backend.utils.logging_utils import logger
 
+# Attribute of a pooled connection that holds its shared cursor (see acquire_cursor)
+_SHARED_CURSOR = "_mysql_admin_cursor"
+
 
 class DatabaseManager:
     """Manages MySQL connection pool and provides connection lifecycle management."""
@@ -13,6 +19,9 @@ class DatabaseManager:
     def __init__(self):
         """Initialize the DatabaseManager."""
         self._pool: Optional[aiomysql.Pool] = None
+        # Connections with CLIENT_MULTI_STATEMENTS, kept apart so the main
+        # pool never accepts stacked statements
+        self._script_pool: Optional[aiomysql.Pool] = None
 
     async def initialize(self) -> None:
         """Initialize the connection pool."""
@@ -28,50 +37,114 @@ class DatabaseManager:
                 password=settings.mysql_password,
                 minsize=settings.mysql_pool_min,
                 maxsize=settings.mysql_pool_max,
+                pool_recycle=settings.mysql_pool_recycle,
+                autocommit=True,
+            )
+            # Opened lazily (minsize=0): scripts are rare compared to single statements
+            self._script_pool = await aiomysql.create_pool(
+                host=settings.mysql_host,
+                port=settings.mysql_port,
+                user=settings.mysql_user,
+                password=settings.mysql_password,
+                minsize=0,
+                maxsize=max(settings.mysql_script_pool_max, 1),
+                pool_recycle=settings.mysql_pool_recycle,
                 autocommit=True,
+                client_flag=CLIENT.MULTI_STATEMENTS,
             )
+
+            # Establish the minimum connections up front so the first requests
+            # don't pay the connect + auth round-trip, and ping one of them
+            # so startup doubles as the connection health check
+            connections = [await self._pool.acquire() for _ in range(max(settings.mysql_pool_min, 1))]
+            try:
+                async with connections[0].cursor() as cursor:
+                    await cursor.execute("SELECT 1")
+            finally:
+                for connection in connections:
+                    self._pool.release(connection)
             logger.info(
-                f"Database connection pool initialized (min={settings.mysql_pool_min}, max={settings.mysql_pool_max})")
+                "Database connection pool initialized (min=%d, max=%d)",
+                settings.mysql_pool_min, settings.mysql_pool_max)
         except Exception as e:
-            logger.error(f"Failed to initialize connection pool: {e}")
+            logger.error("Failed to initialize connection pool: %s", e)
             raise
 
-    async def get_connection(self) -> aiomysql.Connection:
+    @asynccontextmanager
+    async def acquire(
+        self,
+        timeout: Optional[float] = None,
+        multi_statements: bool = False
+    ) -> AsyncIterator[aiomysql.Connection]:
         """
-        Get a connection from the pool.
-        
-        Returns:
+        Acquire a connection from the pool for the duration of a ``with`` block.
+
+        The connection is returned to the pool when the block exits, including
+        when it exits with an exception.
+
+        Args:
+            timeout: Seconds to wait for a free connection; defaults to
+                ``settings.mysql_pool_acquire_timeout``
+            multi_statements: Take the connection from the script pool, whose
+                connections accept several ``;``-separated statements per query
+
+        Yields:
             aiomysql.Connection: A database connection from the pool
-            
+
         Raises:
-            RuntimeError: If the pool is not initialized
-            Exception: If connection acquisition fails
+            RuntimeError: If the pool is not initialized or no connection
+                becomes available within the timeout
         """
-        if self._pool is None:
+        pool = self._script_pool if multi_statements else self._pool
+        if pool is None:
             raise RuntimeError("Connection pool not initialized. Call initialize() first.")
 
+        if timeout is None:
+            timeout = settings.mysql_pool_acquire_timeout
+
         try:
-            connection = await self._pool.acquire()
-            return connection
-        except Exception as e:
-            logger.error(f"Failed to acquire connection: {e}")
-            raise
+            connection = await asyncio.wait_for(pool.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                f"Timed out after {timeout}s waiting for a database connection "
+                f"(pool max={pool.maxsize})"
+            ) from None
+
+        try:
+            yield connection
+        finally:
+            pool.release(connection)
 
-    async def release_connection(self, connection: aiomysql.Connection) -> None:
+    @asynccontextmanager
+    async def acquire_cursor(self, timeout: Optional[float] = None) -> AsyncIterator[aiomysql.Cursor]:
         """
-        Release a connection back to the pool.
-        
+        Acquire a pooled connection and yield its reusable cursor.
+
+        The cursor is created on first use of each connection and kept for the
+        connection's lifetime instead of being opened and closed per statement.
+        It is stored on the connection itself, so the two are freed together
+        once the pool drops the connection. It is meant for statements that
+        return no rows (INSERT/UPDATE/DELETE), since the last result stays
+        buffered on the cursor until its next execute.
+
         Args:
-            connection: The connection to release
-        """
-        if self._pool is None:
-            logger.warning("Cannot release connection: pool not initialized")
-            return
+            timeout: Seconds to wait for a free connection (see ``acquire``)
 
-        try:
-            self._pool.release(connection)
-        except Exception as e:
-            logger.error(f"Failed to release connection: {e}")
+        Yields:
+            aiomysql.Cursor: The connection's shared cursor
+        """
+        async with self.acquire(timeout) as connection:
+            cursor = getattr(connection, _SHARED_CURSOR, None)
+            if cursor is None or cursor.closed:
+                cursor = await connection.cursor()
+                setattr(connection, _SHARED_CURSOR, cursor)
+            try:
+                yield cursor
+            finally:
+                if connection.closed:
+                    # Closed while in use: the pool discards it, so don't
+                    # keep its cursor and last result around until then
+                    setattr(connection, _SHARED_CURSOR, None)
 
     async def close_pool(self) -> None:
         """Close the connection pool and all connections."""
@@ -80,12 +153,16 @@ class DatabaseManager:
             return
 
         try:
+            if self._script_pool is not None:
+                self._script_pool.close()
+                await self._script_pool.wait_closed()
+                self._script_pool = None
             self._pool.close()
             await self._pool.wait_closed()
             self._pool = None
             logger.info("Connection pool closed successfully")
         except Exception as e:
-            logger.error(f"Error closing connection pool: {e}")
+            logger.error("Error closing connection pool: %s", e)
             raise
 
     async def test_connection(self) -> bool:
@@ -99,19 +176,14 @@ class DatabaseManager:
             logger.warning("Connection pool not initialized")
             return False
 
-        connection = None
         try:
-            connection = await self.get_connection()
-            async with connection.cursor() as cursor:
+            async with self.acquire() as connection, connection.cursor() as cursor:
                 await cursor.execute("SELECT 1")
                 result = await cursor.fetchone()
                 return result == (1,)
         except Exception as e:
-            logger.error(f"Connection health check failed: {e}")
+            logger.error("Connection health check failed: %s", e)
             return False
-        finally:
-            if connection:
-                await self.release_connection(connection)
 
 
 # Global database manager instance
@@ -1,31 +1,97 @@
 """Authentication dependency for admin access."""
-from fastapi import Header, HTTPException, status
+import hmac
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from backend.config import settings
+from backend.utils.json_utils import JSONResponse
+
+# Encoded once so each request only pays for the constant-time comparison
+_ADMIN_KEY_BYTES = settings.admin_secret_key.encode("utf-8")
+
+# API paths that do not require the admin key
+_PUBLIC_API_PREFIX = "/api/auth/"
+
+
+def _admin_key_error(x_admin_key: Optional[str]) -> Optional[str]:
+    """
+    Check an admin key from the X-Admin-Key header.
+
+    Args:
+        x_admin_key: Header value, or None if the header is missing
+
+    Returns:
+        The 401 error detail if the key is missing or invalid, otherwise None
+    """
+    if not x_admin_key:
+        return "Admin key is required"
+    if not hmac.compare_digest(x_admin_key.encode("utf-8"), _ADMIN_KEY_BYTES):
+        return "Invalid admin key"
+    return None
 
 
-async def verify_admin_key(x_admin_key: str = Header(None, alias="X-Admin-Key")):
+async def verify_admin_key(request: Request):
     """
     Verify admin secret key from request header.
     
+    The header is read directly from the request instead of through a
+    ``Header()`` parameter, which skips FastAPI's parameter validation.
+    
     Args:
-        x_admin_key: Admin secret key from X-Admin-Key header
+        request: Incoming request carrying the X-Admin-Key header
         
     Raises:
         HTTPException: 401 if key is missing or invalid
     """
-    if not x_admin_key:
+    x_admin_key = request.headers.get("x-admin-key")
+    error = _admin_key_error(x_admin_key)
+    if error is not None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Admin key is required",
+            detail=error,
             headers={"WWW-Authenticate": "AdminKey"}
         )
     
-    if x_admin_key != settings.admin_secret_key:
-        raise HTTPException(
+    return x_admin_key
+
+
+class AdminKeyMiddleware:
+    """
+    ASGI middleware that enforces the X-Admin-Key header on protected API routes.
+
+    Every path under ``/api/`` except ``/api/auth/*`` is protected; the API root,
+    the frontend static files and the login page are not. Checking the key here
+    avoids resolving a FastAPI dependency on every authenticated request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_protected(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        error = _admin_key_error(Headers(scope=scope).get("x-admin-key"))
+        if error is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self._unauthorized(error)(scope, receive, send)
+
+    @staticmethod
+    def _is_protected(path: str) -> bool:
+        """Check whether a request path requires the admin key."""
+        return path.startswith("/api/") and not path.startswith(_PUBLIC_API_PREFIX)
+
+    @staticmethod
+    def _unauthorized(detail: str) -> JSONResponse:
+        """Build the 401 response returned for a missing or invalid key."""
+        return JSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid admin key",
+            content={"detail": detail},
             headers={"WWW-Authenticate": "AdminKey"}
         )
-    
-    return x_admin_key
@@ -1,9 +1,11 @@
+from typing import Union
+
 import aiomysql
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+from backend.utils.json_utils import JSONResponse
 from backend.utils.logging_utils import logger
 
 """
@@ -28,176 +30,165 @@ HTTP Status Code Mapping:
 """
 
 
-def configure_exception(app: FastAPI):
-    @app.exception_handler(aiomysql.Error)
-    async def mysql_error_handler(request: Request, exc: aiomysql.Error):
-        """
-        Handle MySQL database errors.
-
-        Maps MySQL errors to appropriate HTTP status codes:
-        - Connection errors: 503 Service Unavailable
-        - SQL syntax errors: 400 Bad Request
-        - Other database errors: 500 Internal Server Error
-        """
-        error_message = str(exc)
-        logger.error(f"MySQL error on {request.url.path}: {error_message}")
-
-        # Check for connection-related errors
-        if isinstance(exc, (aiomysql.OperationalError, aiomysql.InterfaceError)):
-            return JSONResponse(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                content={
-                    "error": "Database connection error",
-                    "detail": error_message
-                }
-            )
-
-        # Check for SQL syntax errors
-        if isinstance(exc, aiomysql.ProgrammingError):
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "error": "SQL syntax error",
-                    "detail": error_message
-                }
-            )
-
-        # Check for integrity constraint violations
-        if isinstance(exc, aiomysql.IntegrityError):
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "error": "Database integrity constraint violation",
-                    "detail": error_message
-                }
-            )
-
-        # Generic database error
+# MySQL error class -> (HTTP status, error label)
+_MYSQL_ERROR_MAP = {
+    aiomysql.OperationalError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Database connection error"),
+    aiomysql.InterfaceError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Database connection error"),
+    aiomysql.ProgrammingError: (status.HTTP_400_BAD_REQUEST, "SQL syntax error"),
+    aiomysql.IntegrityError: (status.HTTP_400_BAD_REQUEST, "Database integrity constraint violation"),
+}
+_MYSQL_ERROR_DEFAULT = (status.HTTP_500_INTERNAL_SERVER_ERROR, "Database error")
+
+
+async def mysql_error_handler(request: Request, exc: aiomysql.Error):
+    """
+    Handle MySQL database errors.
+
+    Maps MySQL errors to appropriate HTTP status codes:
+    - Connection errors: 503 Service Unavailable
+    - SQL syntax errors: 400 Bad Request
+    - Other database errors: 500 Internal Server Error
+    """
+    error_message = str(exc)
+    logger.error("MySQL error on %s: %s", request.url.path, error_message)
+
+    # Resolve the status from the most specific mapped error class
+    status_code, error_label = _MYSQL_ERROR_DEFAULT
+    for cls in type(exc).__mro__:
+        mapped = _MYSQL_ERROR_MAP.get(cls)
+        if mapped is not None:
+            status_code, error_label = mapped
+            break
+
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "error": error_label,
+            "detail": error_message
+        }
+    )
+
+
+async def validation_error_handler(request: Request, exc: Union[RequestValidationError, ValidationError]):
+    """
+    Handle Pydantic request and model validation errors.
+
+    Returns HTTP 422 with detailed validation error information.
+    """
+    raw_errors = exc.errors(include_url=False) if isinstance(exc, ValidationError) else exc.errors()
+    errors = [
+        {
+            "loc": [loc if type(loc) is str else str(loc) for loc in error["loc"]],
+            "msg": error["msg"],
+            "type": error["type"]
+        }
+        for error in raw_errors
+    ]
+
+    logger.warning("Validation error on %s: %s", request.url.path, errors)
+
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={
+            "error": "Validation error",
+            "detail": errors
+        }
+    )
+
+
+def _is_not_found_message(message: str) -> bool:
+    """
+    Check whether a ValueError message describes a missing resource.
+
+    ValueError messages are short, so a few substring scans over one lowered
+    copy beat a regex search; "not exist" also covers "does not exist".
+    """
+    lowered = message.lower()
+    return "not found" in lowered or "not exist" in lowered or "doesn't exist" in lowered
+
+
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Handle ValueError exceptions.
+
+    ValueError is used throughout the application to indicate:
+    - Invalid input (400 Bad Request)
+    - Resource not found (404 Not Found)
+
+    The handler determines the appropriate status code based on the error message.
+    """
+    error_message = str(exc)
+    logger.warning("ValueError on %s: %s", request.url.path, error_message)
+
+    # Check if it's a "not found" error
+    if _is_not_found_message(error_message):
         return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             content={
-                "error": "Database error",
+                "error": "Resource not found",
                 "detail": error_message
             }
         )
 
-    @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(request: Request, exc: RequestValidationError):
-        """
-        Handle Pydantic request validation errors.
-
-        Returns HTTP 422 with detailed validation error information.
-        """
-        errors = []
-        for error in exc.errors():
-            errors.append({
-                "loc": [str(loc) for loc in error["loc"]],
-                "msg": error["msg"],
-                "type": error["type"]
-            })
-
-        logger.warning(f"Validation error on {request.url.path}: {errors}")
-
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": "Validation error",
-                "detail": errors
-            }
-        )
-
-    @app.exception_handler(ValidationError)
-    async def pydantic_validation_error_handler(request: Request, exc: ValidationError):
-        """
-        Handle Pydantic model validation errors.
+    # Otherwise, treat as bad request
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "error": "Invalid input",
+            "detail": error_message
+        }
+    )
+
+
+async def runtime_error_handler(request: Request, exc: RuntimeError):
+    """
+    Handle RuntimeError exceptions.
+
+    RuntimeError is used for connection pool issues and other runtime problems.
+    Returns HTTP 503 Service Unavailable.
+    """
+    error_message = str(exc)
+    logger.error("RuntimeError on %s: %s", request.url.path, error_message)
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": "Service unavailable",
+            "detail": error_message
+        }
+    )
+
+
+async def generic_exception_handler(request: Request, exc: Exception):
+    """
+    Handle all other unhandled exceptions.
+
+    Returns HTTP 500 Internal Server Error with a generic error message.
+    Logs the full exception for debugging.
+    """
+    logger.exception("Unhandled exception on %s: %s", request.url.path, exc)
+
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": "Internal server error",
+            "detail": "An unexpected error occurred. Please check the server logs."
+        }
+    )
+
+
+# Exception class -> handler. Starlette resolves handlers by walking the
+# exception's MRO against this mapping, so registration order does not matter.
+_EXCEPTION_HANDLERS = {
+    aiomysql.Error: mysql_error_handler,
+    RequestValidationError: validation_error_handler,
+    ValidationError: validation_error_handler,
+    ValueError: value_error_handler,
+    RuntimeError: runtime_error_handler,
+    Exception: generic_exception_handler,
+}
 
-        Returns HTTP 422 with detailed validation error information.
-        """
-        errors = []
-        for error in exc.errors():
-            errors.append({
-                "loc": [str(loc) for loc in error["loc"]],
-                "msg": error["msg"],
-                "type": error["type"]
-            })
 
-        logger.warning(f"Pydantic validation error on {request.url.path}: {errors}")
-
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": "Validation error",
-                "detail": errors
-            }
-        )
-
-    @app.exception_handler(ValueError)
-    async def value_error_handler(request: Request, exc: ValueError):
-        """
-        Handle ValueError exceptions.
-
-        ValueError is used throughout the application to indicate:
-        - Invalid input (400 Bad Request)
-        - Resource not found (404 Not Found)
-
-        The handler determines the appropriate status code based on the error message.
-        """
-        error_message = str(exc)
-        logger.warning(f"ValueError on {request.url.path}: {error_message}")
-
-        # Check if it's a "not found" error
-        not_found_keywords = ["not found", "does not exist", "doesn't exist", "not exist"]
-        if any(keyword in error_message.lower() for keyword in not_found_keywords):
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": "Resource not found",
-                    "detail": error_message
-                }
-            )
-
-        # Otherwise, treat as bad request
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": "Invalid input",
-                "detail": error_message
-            }
-        )
-
-    @app.exception_handler(RuntimeError)
-    async def runtime_error_handler(request: Request, exc: RuntimeError):
-        """
-        Handle RuntimeError exceptions.
-
-        RuntimeError is used for connection pool issues and other runtime problems.
-        Returns HTTP 503 Service Unavailable.
-        """
-        error_message = str(exc)
-        logger.error(f"RuntimeError on {request.url.path}: {error_message}")
-
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "error": "Service unavailable",
-                "detail": error_message
-            }
-        )
-
-    @app.exception_handler(Exception)
-    async def generic_exception_handler(request: Request, exc: Exception):
-        """
-        Handle all other unhandled exceptions.
-
-        Returns HTTP 500 Internal Server Error with a generic error message.
-        Logs the full exception for debugging.
-        """
-        logger.exception(f"Unhandled exception on {request.url.path}: {exc}")
-
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": "Internal server error",
-                "detail": "An unexpected error occurred. Please check the server logs."
-            }
-        )
+def configure_exception(app: FastAPI):
+    for exc_class, handler in _EXCEPTION_HANDLERS.items():
+        app.add_exception_handler(exc_class, handler)
@@ -1,45 +1,75 @@
 """Main FastAPI application with global error handling."""
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from backend.dependencies.auth import verify_admin_key
-from backend.config import get_settings
+from backend.dependencies.auth import AdminKeyMiddleware
+from backend.config import settings
 from backend.database import db_manager
 from backend.exceptions.global_exc import configure_exception
 from backend.routers import auth, databases, tables, data, query, health
-from backend.utils.logging_utils import logger
+from backend.utils.json_utils import JSONResponse
+from backend.utils.logging_utils import login_logger, logger
 
-settings = get_settings()
+
+@asynccontextmanager
+async def database_lifespan(app: FastAPI):
+    """Open the connection pool on startup and close it on shutdown."""
+    # initialize() warms the pool and pings the server, so a separate
+    # connection test is not needed here
+    await db_manager.initialize()
+    logger.info("Database connection established successfully")
+    try:
+        yield
+    finally:
+        try:
+            await db_manager.close_pool()
+            logger.info("Database connection pool closed")
+        except Exception as e:
+            logger.error("Error during shutdown: %s", e)
+
+
+@asynccontextmanager
+async def login_log_lifespan(app: FastAPI):
+    """Close the login log file on shutdown."""
+    try:
+        yield
+    finally:
+        login_logger.close()
+
+
+# Independent startup/shutdown steps, entered concurrently by lifespan()
+LIFESPANS = (database_lifespan, login_log_lifespan)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
     logger.info("Starting MySQL-Admin application...")
-    await db_manager.initialize()
-
-    # Test the connection
-    if await db_manager.test_connection():
-        logger.info("Database connection established successfully")
-    else:
-        logger.warning("Database connection test failed")
+    async with AsyncExitStack() as stack:
+        # Wait for every step to settle before failing so that the ones which
+        # did start are still unwound by the exit stack
+        results = await asyncio.gather(
+            *(stack.enter_async_context(sub_lifespan(app)) for sub_lifespan in LIFESPANS),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        yield
 
-    yield
-
-    # Shutdown
-    try:
         logger.info("Shutting down MySQL-Admin application...")
-        await db_manager.close_pool()
-        logger.info("Database connection pool closed")
-    except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
 
 
-# Configure CORS
+# Configure CORS and admin key authentication
 def configure_middleware(app: FastAPI):
+    # Added first so CORS wraps it: preflight requests and 401 responses
+    # still get CORS handling
+    app.add_middleware(AdminKeyMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -71,12 +101,12 @@ def configure_router(app: FastAPI):
 
     # Auth router (no authentication required)
     app.include_router(auth.router)
-    # Protected routers (require authentication)
-    app.include_router(databases.router, dependencies=[Depends(verify_admin_key)])
-    app.include_router(tables.router, dependencies=[Depends(verify_admin_key)])
-    app.include_router(data.router, dependencies=[Depends(verify_admin_key)])
-    app.include_router(query.router, dependencies=[Depends(verify_admin_key)])
-    app.include_router(health.router, dependencies=[Depends(verify_admin_key)])
+    # Protected routers (authenticated by AdminKeyMiddleware)
+    app.include_router(databases.router)
+    app.include_router(tables.router)
+    app.include_router(data.router)
+    app.include_router(query.router)
+    app.include_router(health.router)
 
 
 # Serve static files (frontend)
@@ -86,7 +116,7 @@ def configure_static_path(app: FastAPI):
         app.mount("/", StaticFiles(directory="frontend", html=True), name="frontend")
         logger.info("Static files middleware configured for frontend")
     except Exception as e:
-        logger.warning(f"Could not mount static files: {e}")
+        logger.warning("Could not mount static files: %s", e)
 
 
 def create_app() -> FastAPI:
@@ -95,6 +125,7 @@ def create_app() -> FastAPI:
         "description": "A web-based database management tool for MySQL with a modern interface.",
         "version": settings.server_version,
         "lifespan": lifespan,
+        "default_response_class": JSONResponse,
         "docs_url": None,
         "redoc_url": None
     }
@@ -1,64 +1,76 @@
 """Pydantic models for API request/response validation."""
-import re
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints
 
-# Validation patterns
-DB_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,64}$')
-TABLE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,64}$')
+# System databases that must never be created through the API (stored lower-cased)
+SYSTEM_DATABASES = frozenset({'information_schema', 'mysql', 'performance_schema', 'sys'})
+# Length of the longest system database name; longer names cannot match
+_SYSTEM_DATABASE_MAX_LEN = max(map(len, SYSTEM_DATABASES))
+
+
+def _reject_system_database(v: str) -> str:
+    """Reject names that collide with a MySQL system database."""
+    if len(v) <= _SYSTEM_DATABASE_MAX_LEN and v.lower() in SYSTEM_DATABASES:
+        raise ValueError(f"Cannot create system database: {v}")
+    return v
+
+
+# Shared identifier pattern for database, table and column names. pydantic-core
+# searches rather than fullmatches, so the anchors are required.
+IDENTIFIER_PATTERN = r'^[a-zA-Z0-9_]{1,64}$'
+
+# Validated types (the constraints are compiled into pydantic-core's schema)
+Identifier = Annotated[str, StringConstraints(pattern=IDENTIFIER_PATTERN, min_length=1, max_length=64)]
+DatabaseName = Annotated[Identifier, AfterValidator(_reject_system_database)]
+SQLStatement = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+class ResponseModel(BaseModel):
+    """
+    Base class for response models, which are built once and never mutated.
+
+    Routers fill them from trusted service results with ``model_construct()``;
+    FastAPI still checks the instance type against ``response_model``.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
 
 # Database Models
 
 class DatabaseCreate(BaseModel):
     """Request model for creating a new database."""
-    name: str = Field(..., min_length=1, max_length=64, description="Database name")
-
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate database name format."""
-        if not DB_NAME_PATTERN.match(v):
-            raise ValueError(
-                "Database name must contain only alphanumeric characters and underscores, "
-                "and be between 1 and 64 characters long"
-            )
-        # Check for system databases
-        system_databases = {'information_schema', 'mysql', 'performance_schema', 'sys'}
-        if v.lower() in system_databases:
-            raise ValueError(f"Cannot create system database: {v}")
-        return v
-
-
-class DatabaseInfo(BaseModel):
+    name: DatabaseName = Field(..., description="Database name")
+
+
+class DatabaseInfo(ResponseModel):
     """Response model for database information."""
     name: str = Field(..., description="Database name")
 
 
-class DatabaseList(BaseModel):
+class DatabaseList(ResponseModel):
     """Response model for list of databases."""
     databases: List[str] = Field(..., description="List of database names")
 
 
-class DatabaseDDL(BaseModel):
+class DatabaseDDL(ResponseModel):
     """Response model for database DDL."""
     ddl: str = Field(..., description="Database DDL statements")
 
 
 # Table Models
 
-class TableInfo(BaseModel):
+class TableInfo(ResponseModel):
     """Response model for table information."""
     name: str = Field(..., description="Table name")
 
 
-class TableList(BaseModel):
+class TableList(ResponseModel):
     """Response model for list of tables."""
     tables: List[str] = Field(..., description="List of table names")
 
 
-class ColumnInfo(BaseModel):
+class ColumnInfo(ResponseModel):
     """Response model for column information."""
     name: str = Field(..., description="Column name")
     type: str = Field(..., description="Column data type")
@@ -68,12 +80,12 @@ class ColumnInfo(BaseModel):
     extra: str = Field(..., description="Extra information (e.g., auto_increment)")
 
 
-class TableStructure(BaseModel):
+class TableStructure(ResponseModel):
     """Response model for table structure."""
     columns: List[ColumnInfo] = Field(..., description="List of column information")
 
 
-class TableData(BaseModel):
+class TableData(ResponseModel):
     """Response model for table data with pagination."""
     columns: List[ColumnInfo] = Field(..., description="Column information")
     rows: List[Dict[str, Any]] = Field(..., description="Row data")
@@ -87,87 +99,75 @@ class TableData(BaseModel):
 
 class RowInsert(BaseModel):
     """Request model for inserting a row."""
-    data: Dict[str, Any] = Field(..., description="Column names to values mapping")
-
-    @field_validator('data')
-    @classmethod
-    def validate_data(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate that data is not empty."""
-        if not v:
-            raise ValueError("Data cannot be empty")
-        return v
+    data: Dict[str, Any] = Field(..., min_length=1, description="Column names to values mapping")
 
 
 class RowUpdate(BaseModel):
     """Request model for updating a row."""
-    pk_column: str = Field(..., min_length=1, max_length=64, description="Primary key column name")
+    pk_column: Identifier = Field(..., description="Primary key column name")
     pk_value: Any = Field(..., description="Primary key value to identify the row")
-    data: Dict[str, Any] = Field(..., description="Column names to new values mapping")
-
-    @field_validator('pk_column')
-    @classmethod
-    def validate_pk_column(cls, v: str) -> str:
-        """Validate primary key column name format."""
-        if not TABLE_NAME_PATTERN.match(v):
-            raise ValueError(
-                "Column name must contain only alphanumeric characters and underscores, "
-                "and be between 1 and 64 characters long"
-            )
-        return v
-
-    @field_validator('data')
-    @classmethod
-    def validate_data(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate that data is not empty."""
-        if not v:
-            raise ValueError("Data cannot be empty")
-        return v
+    data: Dict[str, Any] = Field(..., min_length=1, description="Column names to new values mapping")
 
 
 class RowDelete(BaseModel):
     """Request model for deleting a row."""
-    pk_column: str = Field(..., min_length=1, max_length=64, description="Primary key column name")
+    pk_column: Identifier = Field(..., description="Primary key column name")
     pk_value: Any = Field(..., description="Primary key value to identify the row")
 
-    @field_validator('pk_column')
-    @classmethod
-    def validate_pk_column(cls, v: str) -> str:
-        """Validate primary key column name format."""
-        if not TABLE_NAME_PATTERN.match(v):
-            raise ValueError(
-                "Column name must contain only alphanumeric characters and underscores, "
-                "and be between 1 and 64 characters long"
-            )
-        return v
-
 
 # Query Models
 
 class QueryRequest(BaseModel):
     """Request model for SQL query execution."""
-    sql: str = Field(..., min_length=1, description="SQL statement to execute")
-
-    @field_validator('sql')
-    @classmethod
-    def validate_sql(cls, v: str) -> str:
-        """Validate that SQL is not empty."""
-        if not v.strip():
-            raise ValueError("SQL statement cannot be empty")
-        return v.strip()
+    sql: SQLStatement = Field(..., description="SQL statement to execute")
+    row_format: Literal['objects', 'arrays', 'columns'] = Field(
+        'objects',
+        description='Result shape: "objects" returns a dict per row in "rows", '
+                    '"arrays" returns an array per row in "rows", '
+                    '"columns" returns an array of values per column in "data"'
+    )
+    params: Optional[List[List[Any]]] = Field(
+        None,
+        min_length=1,
+        description="Parameter rows for a bulk statement with %s placeholders; "
+                    "the statement runs once per row in a single call"
+    )
+
+
+class StatementResult(ResponseModel):
+    """Result of one statement in a multi-statement script."""
+    columns: Optional[List[str]] = Field(None, description="Column names (for SELECT queries)")
+    rows: Optional[Union[List[Dict[str, Any]], List[List[Any]]]] = Field(
+        None,
+        description="Row data (for SELECT queries): a dict per row, or an array per row with row_format=\"arrays\""
+    )
+    data: Optional[List[List[Any]]] = Field(None, description="Column-major row data (row_format=\"columns\")")
+    affected_rows: Optional[int] = Field(None, description="Number of affected rows (for DML statements)")
 
 
-class QueryResponse(BaseModel):
+class QueryResponse(ResponseModel):
     """Response model for SQL query execution."""
     success: bool = Field(..., description="Whether the query succeeded")
     columns: Optional[List[str]] = Field(None, description="Column names (for SELECT queries)")
-    rows: Optional[List[Dict[str, Any]]] = Field(None, description="Row data (for SELECT queries)")
+    rows: Optional[Union[List[Dict[str, Any]], List[List[Any]]]] = Field(
+        None,
+        description="Row data (for SELECT queries): a dict per row, or an array per row with row_format=\"arrays\""
+    )
+    data: Optional[List[List[Any]]] = Field(
+        None,
+        description="Row data as one list of values per column (for SELECT queries with row_format=\"columns\")"
+    )
     affected_rows: Optional[int] = Field(None, description="Number of affected rows (for DML statements)")
     error: Optional[str] = Field(None, description="Error message if query failed")
+    results: Optional[List[StatementResult]] = Field(
+        None,
+        description="Per-statement results for multi-statement scripts; the top-level fields mirror the last one"
+    )
 
 
 # Health Check Models
 
-class HealthCheck(BaseModel):
+class HealthCheck(ResponseModel):
     """Response model for health check."""
     status: str = Field(..., description="Health status (healthy/unhealthy)")
     database_connected: bool = Field(..., description="Whether database connection is active")
@@ -176,20 +176,20 @@ class HealthCheck(BaseModel):
 
 # Error Models
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Response model for errors."""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
 
 
-class ValidationErrorDetail(BaseModel):
+class ValidationErrorDetail(ResponseModel):
     """Model for validation error details."""
     loc: List[str] = Field(..., description="Location of the error")
     msg: str = Field(..., description="Error message")
     type: str = Field(..., description="Error type")
 
 
-class ValidationErrorResponse(BaseModel):
+class ValidationErrorResponse(ResponseModel):
     """Response model for validation errors."""
     error: str = Field(default="Validation error", description="Error type")
     detail: List[ValidationErrorDetail] = Field(..., description="List of validation errors")
@@ -197,13 +197,13 @@ class ValidationErrorResponse(BaseModel):
 
 # Success Response Models
 
-class SuccessResponse(BaseModel):
+class SuccessResponse(ResponseModel):
     """Generic success response."""
     success: bool = Field(default=True, description="Operation success status")
     message: str = Field(..., description="Success message")
 
 
-class DeleteResponse(BaseModel):
+class DeleteResponse(ResponseModel):
     """Response model for delete operations."""
     success: bool = Field(default=True, description="Operation success status")
     message: str = Field(..., description="Success message")
@@ -1,4 +1,6 @@
 """API router for authentication endpoints."""
+import hmac
+
 from fastapi import APIRouter, HTTPException, status, Request
 from pydantic import BaseModel
 
@@ -9,6 +11,11 @@ from backend.utils.rate_limiter import rate_limiter
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# Settings are fixed for the life of the process, so bind them once
+_ADMIN_KEY_BYTES = settings.admin_secret_key.encode("utf-8")
+_MAX_ATTEMPTS = settings.max_try_login_time
+_WINDOW_SECONDS = settings.window_seconds
+
 
 class AuthRequest(BaseModel):
     """Authentication request model."""
@@ -45,14 +52,14 @@ async def verify_secret_key(auth: AuthRequest, request: Request):
     # Check rate limit
     is_allowed, attempts_used, seconds_until_reset = rate_limiter.check_rate_limit(
         ip=client_ip,
-        max_attempts=settings.max_try_login_time,
-        window_seconds=settings.window_seconds,
+        max_attempts=_MAX_ATTEMPTS,
+        window_seconds=_WINDOW_SECONDS,
     )
 
     if not is_allowed:
         logger.warning(
-            f"Rate limit exceeded for IP {client_ip}: "
-            f"{attempts_used} attempts, reset in {seconds_until_reset}s"
+            "Rate limit exceeded for IP %s: %d attempts, reset in %ds",
+            client_ip, attempts_used, seconds_until_reset
         )
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -60,30 +67,29 @@ async def verify_secret_key(auth: AuthRequest, request: Request):
         )
 
     # Verify secret key
-    if auth.secret_key == settings.admin_secret_key:
+    if hmac.compare_digest(auth.secret_key.encode("utf-8"), _ADMIN_KEY_BYTES):
         # Successful login - reset rate limit for this IP
         rate_limiter.reset_ip(client_ip)
 
         # Log successful login
         login_logger.log_login_attempt(client_ip, "success")
 
-        logger.info(f"Admin authentication successful from IP {client_ip}")
-        return AuthResponse(
+        logger.info("Admin authentication successful from IP %s", client_ip)
+        return AuthResponse.model_construct(
             success=True,
             message="Authentication successful"
         )
     else:
         # Failed login - record attempt
-        rate_limiter.record_attempt(client_ip)
-        remaining_attempts = settings.max_try_login_time - rate_limiter.get_attempts(
-            client_ip, window_seconds=settings.window_seconds)
+        remaining_attempts = _MAX_ATTEMPTS - rate_limiter.record_attempt(
+            client_ip, window_seconds=_WINDOW_SECONDS)
 
         # Log failed login
         login_logger.log_login_attempt(client_ip, "failed")
 
         logger.warning(
-            f"Admin authentication failed from IP {client_ip}: invalid key "
-            f"({remaining_attempts} attempts remaining)"
+            "Admin authentication failed from IP %s: invalid key (%d attempts remaining)",
+            client_ip, remaining_attempts
         )
 
         if remaining_attempts > 0:
@@ -94,5 +100,5 @@ async def verify_secret_key(auth: AuthRequest, request: Request):
         else:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"登录尝试次数过多，请在 {settings.window_seconds} 秒后重试"
+                detail=f"登录尝试次数过多，请在 {_WINDOW_SECONDS} 秒后重试"
             )
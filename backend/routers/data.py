@@ -34,18 +34,18 @@ async def insert_row(db: str, table: str, row: RowInsert):
     """
     try:
         await data_service.insert_row(db, table, row.data)
-        return SuccessResponse(
+        return SuccessResponse.model_construct(
             success=True,
             message=f"Row inserted successfully into table '{db}.{table}'"
         )
     except ValueError as e:
-        logger.warning(f"Invalid row insertion request: {e}")
+        logger.warning("Invalid row insertion request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to insert row into table '{db}.{table}': {e}")
+        logger.error("Failed to insert row into table '%s.%s': %s", db, table, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to insert row: {str(e)}"
@@ -71,18 +71,18 @@ async def update_row(db: str, table: str, row: RowUpdate):
     """
     try:
         await data_service.update_row(db, table, row.pk_column, row.pk_value, row.data)
-        return SuccessResponse(
+        return SuccessResponse.model_construct(
             success=True,
             message=f"Row updated successfully in table '{db}.{table}'"
         )
     except ValueError as e:
-        logger.warning(f"Invalid row update request: {e}")
+        logger.warning("Invalid row update request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to update row in table '{db}.{table}': {e}")
+        logger.error("Failed to update row in table '%s.%s': %s", db, table, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to update row: {str(e)}"
@@ -108,18 +108,18 @@ async def delete_row(db: str, table: str, row: RowDelete):
     """
     try:
         await data_service.delete_row(db, table, row.pk_column, row.pk_value)
-        return DeleteResponse(
+        return DeleteResponse.model_construct(
             success=True,
             message=f"Row deleted successfully from table '{db}.{table}'"
         )
     except ValueError as e:
-        logger.warning(f"Invalid row deletion request: {e}")
+        logger.warning("Invalid row deletion request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to delete row from table '{db}.{table}': {e}")
+        logger.error("Failed to delete row from table '%s.%s': %s", db, table, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to delete row: {str(e)}"
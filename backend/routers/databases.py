@@ -13,7 +13,9 @@ from backend.utils.logging_utils import logger
 router = APIRouter(prefix="/api/databases", tags=["databases"])
 
 
-@router.get("", response_model=DatabaseList)
+# The names come from a trusted SHOW DATABASES result, so the list is not
+# re-validated through DatabaseList; the model is kept for the OpenAPI schema.
+@router.get("", response_model=None, responses={200: {"model": DatabaseList}})
 async def list_databases():
     """
     List all databases on the MySQL server.
@@ -26,9 +28,9 @@ async def list_databases():
     """
     try:
         databases = await database_service.list_databases()
-        return DatabaseList(databases=databases)
+        return {"databases": databases}
     except Exception as e:
-        logger.error(f"Failed to list databases: {e}")
+        logger.error("Failed to list databases: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to list databases: {str(e)}"
@@ -52,18 +54,18 @@ async def create_database(database: DatabaseCreate):
     """
     try:
         await database_service.create_database(database.name)
-        return DeleteResponse(
+        return DeleteResponse.model_construct(
             success=True,
             message=f"Database '{database.name}' created successfully"
         )
     except ValueError as e:
-        logger.warning(f"Invalid database creation request: {e}")
+        logger.warning("Invalid database creation request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to create database '{database.name}': {e}")
+        logger.error("Failed to create database '%s': %s", database.name, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to create database: {str(e)}"
@@ -87,18 +89,18 @@ async def delete_database(name: str):
     """
     try:
         await database_service.drop_database(name)
-        return DeleteResponse(
+        return DeleteResponse.model_construct(
             success=True,
             message=f"Database '{name}' deleted successfully"
         )
     except ValueError as e:
-        logger.warning(f"Invalid database deletion request: {e}")
+        logger.warning("Invalid database deletion request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to delete database '{name}': {e}")
+        logger.error("Failed to delete database '%s': %s", name, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to delete database: {str(e)}"
@@ -122,15 +124,15 @@ async def get_database_ddl(name: str):
     """
     try:
         ddl = await database_service.get_database_ddl(name)
-        return DatabaseDDL(ddl=ddl)
+        return DatabaseDDL.model_construct(ddl=ddl)
     except ValueError as e:
-        logger.warning(f"Database not found: {e}")
+        logger.warning("Database not found: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to get DDL for database '{name}': {e}")
+        logger.error("Failed to get DDL for database '%s': %s", name, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to get database DDL: {str(e)}"
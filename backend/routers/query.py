@@ -1,17 +1,24 @@
 """API router for SQL query execution endpoint."""
 from fastapi import APIRouter, HTTPException, status
 
+from backend.config import settings
 from backend.models.schemas import (
     QueryRequest,
     QueryResponse
 )
 from backend.services.query_service import query_service
+from backend.services.result_cache import is_cacheable, referenced_tables, result_cache
+from backend.services.table_service import table_service
+from backend.utils.json_utils import JSONResponse
 from backend.utils.logging_utils import logger
 
 router = APIRouter(prefix="/api", tags=["query"])
 
 
-@router.post("/query", response_model=QueryResponse)
+# Query results are serialized straight to JSON rather than re-validated
+# through QueryResponse or walked by jsonable_encoder; the model is kept for
+# the OpenAPI schema.
+@router.post("/query", response_model=None, responses={200: {"model": QueryResponse}})
 async def execute_query(query: QueryRequest):
     """
     Execute any SQL statement (SELECT, INSERT, UPDATE, DELETE, CREATE, DROP, ALTER, etc.).
@@ -28,55 +35,91 @@ async def execute_query(query: QueryRequest):
     """
     try:
         sql = query.sql
+        row_format = query.row_format
+        kind = query_service.classify(sql)
 
-        # Determine if it's a SELECT query (returns rows) or other statement (returns affected rows)
-        if query_service.is_select_query(sql):
-            result = await query_service.execute_query(sql)
-        elif query_service.is_show_query(sql):
-            result = await query_service.execute_query(sql)
+        if query.params is not None:
+            # Bulk statement: every parameter row goes through one executemany call
+            result = await query_service.execute_update(sql, query.params)
+            result_cache.invalidate_statement(sql)
+        elif query_service.is_script(sql):
+            # Several statements: run them in one round-trip on a multi-statement connection
+            result = await query_service.execute_script(sql, row_format)
+            # Scripts may write anywhere, so drop every cached result
+            result_cache.clear()
+            table_service.invalidate_columns()
+            results = result["results"]
+            last = results[-1] if results else {}
+            return JSONResponse({
+                "success": result["success"],
+                "columns": last.get("columns"),
+                "rows": last.get("rows"),
+                "data": last.get("data"),
+                "affected_rows": last.get("affected_rows"),
+                "error": result["error"],
+                "results": results
+            })
+        elif kind in query_service.READ_KINDS:
+            if is_cacheable(sql, kind):
+                # Read query (returns rows): served from the short-lived result cache
+                result = await result_cache.get_or_compute(
+                    result_cache.make_key(sql, row_format),
+                    settings.query_cache_ttl,
+                    lambda: query_service.execute_query(sql, row_format),
+                    tags=referenced_tables(sql)
+                )
+            else:
+                # Locking, writing or time-dependent read: must run every time
+                result = await query_service.execute_query(sql, row_format)
         else:
-            # Execute as a non-SELECT statement (DML, DDL, etc.)
+            # Any other statement (DML, DDL, etc.) returns affected rows
             result = await query_service.execute_update(sql)
+            # Evict cached results for the tables this statement may have changed
+            result_cache.invalidate_statement(sql)
+            if kind != 'DML':
+                # DDL may have changed table columns
+                table_service.invalidate_columns()
 
         # If the service returned an error in the result, return it as-is
         # (this happens for SQL syntax errors caught by MySQL)
         if not result.get("success", False):
-            return QueryResponse(
-                success=False,
-                columns=None,
-                rows=None,
-                affected_rows=None,
-                error=result.get("error", "Query execution failed")
-            )
+            return JSONResponse({
+                "success": False,
+                "columns": None,
+                "rows": None,
+                "affected_rows": None,
+                "error": result.get("error", "Query execution failed")
+            })
 
         # Return successful result
-        if "columns" in result and "rows" in result:
-            # SELECT query result
-            return QueryResponse(
-                success=True,
-                columns=result["columns"],
-                rows=result["rows"],
-                affected_rows=None,
-                error=None
-            )
+        if "columns" in result:
+            # SELECT query result, in whichever shape was requested
+            return JSONResponse({
+                "success": True,
+                "columns": result["columns"],
+                "rows": result.get("rows"),
+                "data": result.get("data"),
+                "affected_rows": None,
+                "error": None
+            })
         else:
             # DML statement result
-            return QueryResponse(
-                success=True,
-                columns=None,
-                rows=None,
-                affected_rows=result.get("affected_rows", 0),
-                error=None
-            )
+            return JSONResponse({
+                "success": True,
+                "columns": None,
+                "rows": None,
+                "affected_rows": result.get("affected_rows", 0),
+                "error": None
+            })
 
     except ValueError as e:
-        logger.warning(f"Invalid query request: {e}")
+        logger.warning("Invalid query request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to execute query: {e}")
+        logger.error("Failed to execute query: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Query execution failed: {str(e)}"
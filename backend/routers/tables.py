@@ -1,21 +1,53 @@
 """API router for table management endpoints."""
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 
+from backend.config import settings
 from backend.models.schemas import (
+    ColumnInfo,
     TableList,
     TableData,
     TableStructure,
     DeleteResponse
 )
 from backend.services.table_service import table_service
+from backend.utils.json_utils import JSONResponse, dumps
 from backend.utils.logging_utils import logger
+from backend.utils.singleflight import Singleflight
 
 router = APIRouter(prefix="/api/databases", tags=["tables"])
 
+# Identical buffered page requests that arrive together (several open tabs
+# polling the same page) share one MySQL round-trip
+_table_data_calls: Singleflight[Dict[str, Any]] = Singleflight()
 
-@router.get("/{db}/tables", response_model=TableList)
+
+async def _table_data_json(
+    metadata: Dict[str, Any],
+    batches: AsyncIterator[List[Dict[str, Any]]]
+) -> AsyncIterator[bytes]:
+    """Encode streamed table data as the same JSON object ``get_table_data`` returns."""
+    try:
+        # Splice the row array into the metadata object: {...,"rows":[...]}
+        yield dumps(metadata)[:-1] + b',"rows":['
+        separator = b""
+        async for rows in batches:
+            yield separator + b",".join([dumps(row) for row in rows])
+            separator = b","
+        yield b"]}"
+    except Exception as e:
+        # Headers are already sent, so the client sees a truncated body
+        logger.error("Failed while streaming table data: %s", e)
+        raise
+    finally:
+        await batches.aclose()
+
+
+# The names come from a trusted SHOW TABLES result, so the list is not
+# re-validated through TableList; the model is kept for the OpenAPI schema.
+@router.get("/{db}/tables", response_model=None, responses={200: {"model": TableList}})
 async def list_tables(db: str):
     """
     List all tables in a database.
@@ -32,15 +64,15 @@ async def list_tables(db: str):
     """
     try:
         tables = await table_service.list_tables(db)
-        return TableList(tables=tables)
+        return {"tables": tables}
     except ValueError as e:
-        logger.warning(f"Invalid request to list tables: {e}")
+        logger.warning("Invalid request to list tables: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to list tables in database '{db}': {e}")
+        logger.error("Failed to list tables in database '%s': %s", db, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to list tables: {str(e)}"
@@ -65,25 +97,29 @@ async def delete_table(db: str, table: str):
     """
     try:
         await table_service.drop_table(db, table)
-        return DeleteResponse(
+        return DeleteResponse.model_construct(
             success=True,
             message=f"Table '{table}' deleted successfully from database '{db}'"
         )
     except ValueError as e:
-        logger.warning(f"Invalid table deletion request: {e}")
+        logger.warning("Invalid table deletion request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to delete table '{table}' from database '{db}': {e}")
+        logger.error("Failed to delete table '%s' from database '%s': %s", table, db, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to delete table: {str(e)}"
         )
 
 
-@router.get("/{db}/tables/{table}/data", response_model=TableData)
+# Rows come straight from MySQL, so they are serialized directly rather than
+# re-validated through TableData or walked by jsonable_encoder; the model is
+# kept for the OpenAPI schema. Large pages are streamed from a server-side
+# cursor instead of buffered.
+@router.get("/{db}/tables/{table}/data", response_model=None, responses={200: {"model": TableData}})
 async def get_table_data(
     db: str, 
     table: str,
@@ -110,16 +146,25 @@ async def get_table_data(
         HTTPException: 503 if database connection fails
     """
     try:
-        data = await table_service.get_table_data(db, table, filter, page, page_size)
-        return TableData(**data)
+        if page_size < settings.table_data_stream_min_page_size:
+            data = await _table_data_calls.do(
+                (db, table, filter, page, page_size),
+                lambda: table_service.get_table_data(db, table, filter, page, page_size)
+            )
+            return JSONResponse(data)
+
+        batches = table_service.stream_table_data(db, table, filter, page, page_size)
+        # Prime the generator so validation and MySQL errors map to HTTP errors
+        metadata = await batches.__anext__()
+        return StreamingResponse(_table_data_json(metadata, batches), media_type="application/json")
     except ValueError as e:
-        logger.warning(f"Invalid request to get table data: {e}")
+        logger.warning("Invalid request to get table data: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to get data from table '{db}.{table}': {e}")
+        logger.error("Failed to get data from table '%s.%s': %s", db, table, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to get table data: {str(e)}"
@@ -144,15 +189,15 @@ async def get_table_structure(db: str, table: str):
     """
     try:
         columns = await table_service.get_table_structure(db, table)
-        return TableStructure(columns=columns)
+        return TableStructure.model_construct(columns=[ColumnInfo.model_construct(**col) for col in columns])
     except ValueError as e:
-        logger.warning(f"Invalid request to get table structure: {e}")
+        logger.warning("Invalid request to get table structure: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to get structure for table '{db}.{table}': {e}")
+        logger.error("Failed to get structure for table '%s.%s': %s", db, table, e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to get table structure: {str(e)}"
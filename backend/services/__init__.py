@@ -3,10 +3,12 @@ from backend.services.database_service import DatabaseService, database_service
 from backend.services.table_service import TableService, table_service
 from backend.services.data_service import DataService, data_service
 from backend.services.query_service import QueryService, query_service
+from backend.services.result_cache import ResultCache, result_cache
 
 __all__ = [
     'DatabaseService', 'database_service',
     'TableService', 'table_service',
     'DataService', 'data_service',
-    'QueryService', 'query_service'
+    'QueryService', 'query_service',
+    'ResultCache', 'result_cache'
 ]
@@ -1,18 +1,156 @@
 """Data service layer for row-level CRUD operations."""
+import asyncio
+import copy
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import aiomysql
 
+from backend.config import settings
 from backend.database import db_manager
+from backend.services.result_cache import result_cache
+from backend.services.table_service import table_service
 from backend.utils.logging_utils import logger
 
+# Valid identifier pattern: alphanumeric and underscore, 1-64 characters.
+# \Z (rather than $) so a trailing newline is not accepted.
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z0-9_]{1,64}\Z')
+_ID_MATCH = _IDENTIFIER_RE.match
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_identifier(name: str) -> bool:
+    """Return whether ``name`` is a valid identifier; cached across requests."""
+    return _ID_MATCH(name) is not None
+
+
+@lru_cache(maxsize=1024)
+def _insert_sql(database: str, table: str, columns: Tuple[str, ...], row_count: int = 1) -> str:
+    """Build the parameterized multi-row INSERT statement for a column set."""
+    column_list = ", ".join([f"`{col}`" for col in columns])
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    placeholders = ", ".join([row_placeholders] * row_count)
+    return f"INSERT INTO `{database}`.`{table}` ({column_list}) VALUES {placeholders}"
+
+
+@lru_cache(maxsize=1024)
+def _update_sql(database: str, table: str, columns: Tuple[str, ...], pk_column: str) -> str:
+    """Build the parameterized single-row UPDATE statement for a column set."""
+    set_clause = ", ".join([f"`{col}` = %s" for col in columns])
+    return f"UPDATE `{database}`.`{table}` SET {set_clause} WHERE `{pk_column}` = %s"
+
+
+@lru_cache(maxsize=1024)
+def _delete_sql(database: str, table: str, pk_column: str) -> str:
+    """Build the parameterized single-row DELETE statement."""
+    return f"DELETE FROM `{database}`.`{table}` WHERE `{pk_column}` = %s"
+
+
+@lru_cache(maxsize=1024)
+def _select_by_key_sql(database: str, table: str, key_column: str) -> str:
+    """Build the parameterized single-row SELECT statement."""
+    return f"SELECT * FROM `{database}`.`{table}` WHERE `{key_column}` = %s"
+
+
+# MySQL error code -> builder of the ValueError shown to the user. Messages
+# are only formatted when the error actually occurs.
+ErrorTranslator = Callable[[aiomysql.Error, str, str, Optional[str]], ValueError]
+
+
+def _table_missing(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Table '{table}' does not exist in database '{database}'")
+
+
+def _database_missing(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Database '{database}' does not exist")
+
+
+def _unknown_column(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Unknown column in table '{table}': {e.args[1]}")
+
+
+def _unknown_pk_column(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Unknown column '{pk_column}' in table '{table}': {e.args[1]}")
+
+
+def _data_invalid(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Data validation failed: {e.args[1]}")
+
+
+def _row_referenced(e: aiomysql.Error, database: str, table: str, pk_column: Optional[str] = None) -> ValueError:
+    return ValueError(f"Cannot delete row: foreign key constraint violation: {e.args[1]}")
+
+
+# 1146: no such table, 1049: no such database
+_MISSING_ERRORS: Dict[int, ErrorTranslator] = {1146: _table_missing, 1049: _database_missing}
+
+# Errors caused by the values of one row: 1062 duplicate key, 1048 NULL in a
+# NOT NULL column, 1364 missing value, 1452 foreign key, 1406/1264 value
+# too long / out of range
+_ROW_DATA_ERRORS = frozenset((1062, 1048, 1364, 1452, 1406, 1264))
+
+# 1054: unknown column
+_INSERT_ERRORS: Dict[int, ErrorTranslator] = {
+    **_MISSING_ERRORS,
+    1054: _unknown_column,
+    **dict.fromkeys(_ROW_DATA_ERRORS, _data_invalid),
+}
+_UPDATE_ERRORS: Dict[int, ErrorTranslator] = {
+    **_MISSING_ERRORS,
+    1054: _unknown_column,
+    **dict.fromkeys((1062, 1048, 1452, 1406, 1264), _data_invalid),
+}
+# 1451: row is referenced by a foreign key
+_DELETE_ERRORS: Dict[int, ErrorTranslator] = {
+    **_MISSING_ERRORS,
+    1054: _unknown_pk_column,
+    1451: _row_referenced,
+}
+
+
+# Storage engines that undo a failed statement completely
+_TRANSACTIONAL_ENGINES = frozenset(("INNODB", "NDBCLUSTER", "NDB", "ROCKSDB", "TOKUDB"))
+
+
+def _copy_error(error: Exception) -> Exception:
+    """
+    Return a separate instance of ``error`` for one caller of a failed batch.
+    
+    Each caller re-raises what it is given, which sets the exception's
+    traceback and context; with one shared instance the callers would
+    overwrite each other's. An error that can't be copied is shared as is.
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
+
+
+class _InsertBatch:
+    """Rows queued for one multi-row INSERT, plus the futures of their callers."""
+
+    __slots__ = ("rows", "futures", "full")
+
+    def __init__(self):
+        self.rows: List[List[Any]] = []
+        self.futures: List[asyncio.Future] = []
+        self.full = asyncio.Event()
+
 
 class DataService:
     """Handles row-level CRUD operations."""
     
-    # Valid identifier pattern: alphanumeric and underscore, 1-64 characters
-    IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,64}$')
+    IDENTIFIER_PATTERN = _IDENTIFIER_RE
+    
+    def __init__(self):
+        """Initialize the DataService."""
+        # Pending insert batches keyed by (database, table, columns)
+        self._insert_batches: Dict[Tuple[str, str, Tuple[str, ...]], _InsertBatch] = {}
+        # Strong references to running flush tasks so they aren't garbage collected
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # (database, table) -> whether its engine rolls back a failed statement
+        self._transactional_tables: Dict[Tuple[str, str], bool] = {}
     
     @staticmethod
     def _validate_identifier(name: str, identifier_type: str = "identifier") -> None:
@@ -26,14 +164,31 @@ class DataService:
         Raises:
             ValueError: If the name is invalid
         """
+        if name and _is_valid_identifier(name):
+            return
+        
         if not name:
             raise ValueError(f"{identifier_type} cannot be empty")
         
-        if not DataService.IDENTIFIER_PATTERN.match(name):
-            raise ValueError(
-                f"{identifier_type} must contain only alphanumeric characters and underscores, "
-                "and be between 1 and 64 characters long"
-            )
+        raise ValueError(
+            f"{identifier_type} must contain only alphanumeric characters and underscores, "
+            "and be between 1 and 64 characters long"
+        )
+    
+    def _validate_columns(self, columns: Iterable[str]) -> None:
+        """
+        Validate all column names in one pass.
+        
+        Raises:
+            ValueError: For the first invalid column name
+        """
+        bad = next(
+            (col for col in columns if not (col and _is_valid_identifier(col))),
+            None
+        )
+        if bad is not None:
+            # Cold path: reuse the single-name check for its error message
+            self._validate_identifier(bad, "Column name")
     
     @staticmethod
     def _sanitize_value(value: Any) -> Any:
@@ -57,7 +212,7 @@ class DataService:
         database: str, 
         table: str, 
         data: Dict[str, Any]
-    ) -> None:
+    ) -> Optional[int]:
         """
         Insert a new row into a table.
         
@@ -66,6 +221,12 @@ class DataService:
             table: Name of the table
             data: Dictionary of column names to values
             
+        Returns:
+            The AUTO_INCREMENT id of the new row, or None if the table has no
+            AUTO_INCREMENT column or the row was written in a multi-row batch
+            (see ``_flush_insert_batch``); use ``insert_and_fetch`` when the id
+            is always needed
+            
         Raises:
             ValueError: If database/table name is invalid or data is empty
             Exception: If the insertion fails
@@ -77,48 +238,283 @@ class DataService:
             raise ValueError("Data cannot be empty")
         
         # Validate column names
-        for column in data.keys():
-            self._validate_identifier(column, "Column name")
+        self._validate_columns(data)
+        
+        columns = tuple(data.keys())
+        values = [self._sanitize_value(data[col]) for col in columns]
         
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            
-            # Build parameterized INSERT query
-            columns = list(data.keys())
-            values = [self._sanitize_value(data[col]) for col in columns]
-            
-            # Create column list and placeholder list
-            column_list = ", ".join([f"`{col}`" for col in columns])
-            placeholders = ", ".join(["%s"] * len(columns))
+            row_id = await self._submit_insert(database, table, columns, values)
+            result_cache.invalidate_table(database, table)
+            logger.info("Inserted row into table '%s.%s'", database, table)
+            return row_id
+                
+        except aiomysql.Error as e:
+            translate = _INSERT_ERRORS.get(e.args[0])
+            if translate is not None:
+                raise translate(e, database, table)
+            logger.error("Failed to insert row into table '%s.%s': %s", database, table, e)
+            raise
+        except Exception as e:
+            logger.error("Failed to insert row into table '%s.%s': %s", database, table, e)
+            raise
+    
+    async def insert_and_fetch(
+        self,
+        database: str,
+        table: str,
+        data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Insert a new row and return it as stored, including defaults and
+        generated values.
+        
+        The row is read back by its AUTO_INCREMENT id on the connection that
+        inserted it, so unlike ``insert_row`` the INSERT is not batched.
+        
+        Args:
+            database: Name of the database
+            table: Name of the table
+            data: Dictionary of column names to values
             
-            query = f"INSERT INTO `{database}`.`{table}` ({column_list}) VALUES ({placeholders})"
+        Returns:
+            Dict of column names to values of the inserted row
             
-            async with connection.cursor() as cursor:
-                await cursor.execute(query, values)
-                logger.info(f"Inserted row into table '{database}.{table}'")
+        Raises:
+            ValueError: If database/table name is invalid, data is empty, or
+                the table has no AUTO_INCREMENT column
+            Exception: If the insertion fails
+        """
+        self._validate_identifier(database, "Database name")
+        self._validate_identifier(table, "Table name")
+        
+        if not data:
+            raise ValueError("Data cannot be empty")
+        
+        # Validate column names
+        self._validate_columns(data)
+        
+        # Column metadata is cached by the table service, so this is usually free
+        structure = await table_service.get_table_structure(database, table)
+        id_column = next((col["name"] for col in structure if "auto_increment" in col["extra"]), None)
+        if id_column is None:
+            raise ValueError(f"Table '{table}' has no AUTO_INCREMENT column")
+        
+        columns = tuple(data.keys())
+        values = [self._sanitize_value(data[col]) for col in columns]
+        
+        try:
+            async with db_manager.acquire() as connection, connection.cursor() as cursor:
+                await cursor.execute(_insert_sql(database, table, columns), values)
+                await cursor.execute(_select_by_key_sql(database, table, id_column), [cursor.lastrowid])
+                row = await cursor.fetchone()
+                names = [desc[0] for desc in cursor.description]
+            result_cache.invalidate_table(database, table)
+            logger.info("Inserted row into table '%s.%s'", database, table)
+            return dict(zip(names, row))
                 
         except aiomysql.Error as e:
-            # Check for table doesn't exist error (error code 1146)
-            if e.args[0] == 1146:
-                raise ValueError(f"Table '{table}' does not exist in database '{database}'")
-            # Check for database doesn't exist error (error code 1049)
-            if e.args[0] == 1049:
-                raise ValueError(f"Database '{database}' does not exist")
-            # Check for unknown column error (error code 1054)
-            if e.args[0] == 1054:
-                raise ValueError(f"Unknown column in table '{table}': {e.args[1]}")
-            # Check for constraint violations (error codes 1062, 1048, 1364, 1452, etc.)
-            if e.args[0] in (1062, 1048, 1364, 1452, 1406, 1264):
-                raise ValueError(f"Data validation failed: {e.args[1]}")
-            logger.error(f"Failed to insert row into table '{database}.{table}': {e}")
+            translate = _INSERT_ERRORS.get(e.args[0])
+            if translate is not None:
+                raise translate(e, database, table)
+            logger.error("Failed to insert row into table '%s.%s': %s", database, table, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to insert row into table '{database}.{table}': {e}")
+            logger.error("Failed to insert row into table '%s.%s': %s", database, table, e)
             raise
+    
+    @staticmethod
+    async def _execute_insert(
+        database: str,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[List[Any]]
+    ) -> int:
+        """
+        Insert one or more rows with a single multi-row INSERT statement.
+        
+        Args:
+            database: Name of the database
+            table: Name of the table
+            columns: Column names shared by every row
+            rows: Row values, each in the same order as ``columns``
+            
+        Returns:
+            The AUTO_INCREMENT id of the first row, or 0 if there is none
+        """
+        query = _insert_sql(database, table, columns, len(rows))
+        params = [value for row in rows for value in row]
+        
+        async with db_manager.acquire_cursor() as cursor:
+            await cursor.execute(query, params)
+            return cursor.lastrowid
+    
+    async def _submit_insert(
+        self,
+        database: str,
+        table: str,
+        columns: Tuple[str, ...],
+        values: List[Any]
+    ) -> Optional[int]:
+        """
+        Queue a row for a batched INSERT and wait until it has been written.
+        
+        Rows for the same table and column set that arrive within
+        ``insert_batch_wait_time`` seconds (or until ``insert_batch_max_rows``
+        rows are queued) share one multi-row INSERT round-trip.
+        
+        Returns:
+            The AUTO_INCREMENT id of the row, or None if there is none or the
+            row was written in a multi-row batch
+        
+        Raises:
+            aiomysql.Error: If inserting this row fails
+        """
+        if settings.insert_batch_max_rows <= 1:
+            return await self._execute_insert(database, table, columns, [values]) or None
+        
+        key = (database, table, columns)
+        batch = self._insert_batches.get(key)
+        if batch is None:
+            batch = self._insert_batches[key] = _InsertBatch()
+            task = asyncio.create_task(self._flush_insert_batch(key, batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        
+        future = asyncio.get_running_loop().create_future()
+        batch.rows.append(values)
+        batch.futures.append(future)
+        
+        if len(batch.rows) >= settings.insert_batch_max_rows:
+            # Close the batch so later rows start a new one
+            del self._insert_batches[key]
+            batch.full.set()
+        
+        return await future
+    
+    async def _flush_insert_batch(
+        self,
+        key: Tuple[str, str, Tuple[str, ...]],
+        batch: _InsertBatch
+    ) -> None:
+        """
+        Write a queued batch once it is full or its wait time has elapsed.
+        
+        Every caller's future is completed however the flush ends: if the
+        task is cancelled (e.g. at shutdown) the callers are cancelled too,
+        and an unexpected error is passed on to each of them.
+        """
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), settings.insert_batch_wait_time)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                # Close the batch, also when cancelled, so later rows start a new one
+                if self._insert_batches.get(key) is batch:
+                    del self._insert_batches[key]
+            
+            await self._write_insert_batch(*key, batch)
+        except Exception as e:
+            logger.error("Failed to flush batched insert into '%s.%s': %s", key[0], key[1], e)
+            for future in batch.futures:
+                self._resolve(future, _copy_error(e))
         finally:
-            if connection:
-                await db_manager.release_connection(connection)
+            # Only a cancelled flush leaves futures pending here
+            for future in batch.futures:
+                future.cancel()
+    
+    async def _write_insert_batch(
+        self,
+        database: str,
+        table: str,
+        columns: Tuple[str, ...],
+        batch: _InsertBatch
+    ) -> None:
+        """
+        Write a batch with one multi-row INSERT and resolve its callers' futures.
+        
+        If the multi-row INSERT fails because of one row's values, and the
+        table's engine rolled the whole statement back, the rows are retried
+        one at a time so that each caller receives the error for its own row
+        only. Any other failure (lost connection, pool timeout, or a
+        non-transactional table that may have kept some rows) fails every
+        caller of the batch with the original error.
+        
+        A caller's future is resolved with its row's AUTO_INCREMENT id only
+        when the row was inserted on its own. The ids of a multi-row INSERT
+        can't be mapped back to rows: explicit ids, auto_increment_increment
+        and interleaved lock mode all break the "first id plus offset" rule,
+        so those callers get None.
+        """
+        try:
+            first_id = await self._execute_insert(database, table, columns, batch.rows)
+        except Exception as e:
+            if (
+                len(batch.rows) == 1
+                or not (isinstance(e, aiomysql.Error) and e.args and e.args[0] in _ROW_DATA_ERRORS)
+                or not await self._is_transactional(database, table)
+            ):
+                for future in batch.futures:
+                    self._resolve(future, _copy_error(e))
+                return
+            logger.warning(
+                "Batched insert of %d rows into '%s.%s' failed, retrying row by row: %s",
+                len(batch.rows), database, table, e
+            )
+            for row, future in zip(batch.rows, batch.futures):
+                try:
+                    row_id = await self._execute_insert(database, table, columns, [row])
+                except Exception as row_error:
+                    self._resolve(future, row_error)
+                else:
+                    self._resolve(future, row_id=row_id or None)
+        else:
+            if len(batch.rows) == 1:
+                self._resolve(batch.futures[0], row_id=first_id or None)
+            else:
+                for future in batch.futures:
+                    self._resolve(future)
+    
+    async def _is_transactional(self, database: str, table: str) -> bool:
+        """
+        Return whether a failed statement on the table leaves no rows behind.
+        
+        Only asked after a batched INSERT failed, and cached per table. A
+        failed lookup counts as non-transactional, which fails the batch
+        rather than risk writing rows twice.
+        """
+        key = (database, table)
+        transactional = self._transactional_tables.get(key)
+        if transactional is None:
+            try:
+                async with db_manager.acquire() as connection, connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT ENGINE FROM information_schema.TABLES "
+                        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+                        [database, table]
+                    )
+                    row = await cursor.fetchone()
+            except Exception as e:
+                logger.warning("Failed to look up the engine of '%s.%s': %s", database, table, e)
+                return False
+            engine = (row[0] or "").upper() if row else ""
+            transactional = self._transactional_tables[key] = engine in _TRANSACTIONAL_ENGINES
+        return transactional
+    
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future,
+        error: Exception = None,
+        row_id: Optional[int] = None
+    ) -> None:
+        """Complete a caller's future unless the caller has already gone away."""
+        if future.done():
+            return
+        if error is None:
+            future.set_result(row_id)
+        else:
+            future.set_exception(error)
     
     async def update_row(
         self,
@@ -150,60 +546,42 @@ class DataService:
             raise ValueError("Data cannot be empty")
         
         # Validate column names
-        for column in data.keys():
-            self._validate_identifier(column, "Column name")
+        self._validate_columns(data)
         
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            
             # Build parameterized UPDATE query
-            columns = list(data.keys())
+            columns = tuple(data.keys())
             values = [self._sanitize_value(data[col]) for col in columns]
             
-            # Create SET clause
-            set_clause = ", ".join([f"`{col}` = %s" for col in columns])
-            
-            query = f"UPDATE `{database}`.`{table}` SET {set_clause} WHERE `{pk_column}` = %s"
+            query = _update_sql(database, table, columns, pk_column)
             
             # Append pk_value to the values list
             values.append(self._sanitize_value(pk_value))
             
-            async with connection.cursor() as cursor:
+            async with db_manager.acquire_cursor() as cursor:
                 affected_rows = await cursor.execute(query, values)
-                
+                result_cache.invalidate_table(database, table)
+            
                 if affected_rows == 0:
                     logger.warning(
-                        f"No rows updated in table '{database}.{table}' "
-                        f"with {pk_column}={pk_value}"
+                        "No rows updated in table '%s.%s' with %s=%s",
+                        database, table, pk_column, pk_value
                     )
                 else:
                     logger.info(
-                        f"Updated {affected_rows} row(s) in table '{database}.{table}' "
-                        f"with {pk_column}={pk_value}"
+                        "Updated %d row(s) in table '%s.%s' with %s=%s",
+                        affected_rows, database, table, pk_column, pk_value
                     )
-                
+            
         except aiomysql.Error as e:
-            # Check for table doesn't exist error (error code 1146)
-            if e.args[0] == 1146:
-                raise ValueError(f"Table '{table}' does not exist in database '{database}'")
-            # Check for database doesn't exist error (error code 1049)
-            if e.args[0] == 1049:
-                raise ValueError(f"Database '{database}' does not exist")
-            # Check for unknown column error (error code 1054)
-            if e.args[0] == 1054:
-                raise ValueError(f"Unknown column in table '{table}': {e.args[1]}")
-            # Check for constraint violations
-            if e.args[0] in (1062, 1048, 1452, 1406, 1264):
-                raise ValueError(f"Data validation failed: {e.args[1]}")
-            logger.error(f"Failed to update row in table '{database}.{table}': {e}")
+            translate = _UPDATE_ERRORS.get(e.args[0])
+            if translate is not None:
+                raise translate(e, database, table)
+            logger.error("Failed to update row in table '%s.%s': %s", database, table, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to update row in table '{database}.{table}': {e}")
+            logger.error("Failed to update row in table '%s.%s': %s", database, table, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
     
     async def delete_row(
         self,
@@ -229,48 +607,34 @@ class DataService:
         self._validate_identifier(table, "Table name")
         self._validate_identifier(pk_column, "Primary key column name")
         
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            
             # Build parameterized DELETE query
-            query = f"DELETE FROM `{database}`.`{table}` WHERE `{pk_column}` = %s"
+            query = _delete_sql(database, table, pk_column)
             
-            async with connection.cursor() as cursor:
+            async with db_manager.acquire_cursor() as cursor:
                 affected_rows = await cursor.execute(query, [self._sanitize_value(pk_value)])
-                
+                result_cache.invalidate_table(database, table)
+            
                 if affected_rows == 0:
                     logger.warning(
-                        f"No rows deleted from table '{database}.{table}' "
-                        f"with {pk_column}={pk_value}"
+                        "No rows deleted from table '%s.%s' with %s=%s",
+                        database, table, pk_column, pk_value
                     )
                 else:
                     logger.info(
-                        f"Deleted {affected_rows} row(s) from table '{database}.{table}' "
-                        f"with {pk_column}={pk_value}"
+                        "Deleted %d row(s) from table '%s.%s' with %s=%s",
+                        affected_rows, database, table, pk_column, pk_value
                     )
-                
+            
         except aiomysql.Error as e:
-            # Check for table doesn't exist error (error code 1146)
-            if e.args[0] == 1146:
-                raise ValueError(f"Table '{table}' does not exist in database '{database}'")
-            # Check for database doesn't exist error (error code 1049)
-            if e.args[0] == 1049:
-                raise ValueError(f"Database '{database}' does not exist")
-            # Check for unknown column error (error code 1054)
-            if e.args[0] == 1054:
-                raise ValueError(f"Unknown column '{pk_column}' in table '{table}': {e.args[1]}")
-            # Check for foreign key constraint violations (error code 1451)
-            if e.args[0] == 1451:
-                raise ValueError(f"Cannot delete row: foreign key constraint violation: {e.args[1]}")
-            logger.error(f"Failed to delete row from table '{database}.{table}': {e}")
+            translate = _DELETE_ERRORS.get(e.args[0])
+            if translate is not None:
+                raise translate(e, database, table, pk_column)
+            logger.error("Failed to delete row from table '%s.%s': %s", database, table, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to delete row from table '{database}.{table}': {e}")
+            logger.error("Failed to delete row from table '%s.%s': %s", database, table, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
 
 
 # Global data service instance
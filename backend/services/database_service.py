@@ -1,21 +1,55 @@
 """Database service layer for database-level operations."""
-import re
+from functools import lru_cache
 from typing import List
 
 import aiomysql
 
 from backend.database import db_manager
+from backend.services.result_cache import result_cache
+from backend.services.table_service import table_service
 from backend.utils.logging_utils import logger
+from backend.utils.swr_cache import StaleWhileRevalidate
+
+# Bytes allowed in a database name; deleting them with bytes.translate leaves
+# nothing behind for a valid name
+_NAME_CHARS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_'
+
+
+def _is_valid_name(name: str) -> bool:
+    """Check ``name`` is 1-64 characters of ``[a-zA-Z0-9_]`` without running a regex."""
+    return (
+        name.isascii()
+        and 0 < len(name) <= 64
+        and not name.encode().translate(None, _NAME_CHARS)
+    )
+
+
+# Statement templates, bound once; callers pass a name from _quote_database
+_CREATE_DB_SQL = "CREATE DATABASE {}".format
+_DROP_DB_SQL = "DROP DATABASE {}".format
+_DDL_HEADER = "-- Database: {0}\nCREATE DATABASE IF NOT EXISTS `{0}`;\nUSE `{0}`;\n\n".format
+
+# MySQL error code -> message template for the ValueError shown to the user
+# 1007: database exists
+_CREATE_ERRORS = {1007: "Database '{}' already exists".format}
+# 1008: database doesn't exist
+_DROP_ERRORS = {1008: "Database '{}' does not exist".format}
 
 
 class DatabaseService:
     """Handles database-level operations."""
     
-    # Valid database name pattern: alphanumeric and underscore, 1-64 characters
-    DB_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,64}$')
-    
     # System databases that should not be modified
-    SYSTEM_DATABASES = {'information_schema', 'mysql', 'performance_schema', 'sys'}
+    SYSTEM_DATABASES = frozenset({'information_schema', 'mysql', 'performance_schema', 'sys'})
+    _SYSTEM_DATABASE_LENGTHS = frozenset(len(db) for db in SYSTEM_DATABASES)
+    
+    def __init__(self):
+        """Initialize the DatabaseService."""
+        # The UI lists databases on every navigation, so SHOW DATABASES is
+        # served from a short-lived cache that refreshes in the background
+        self._databases_cache: StaleWhileRevalidate[List[str]] = StaleWhileRevalidate(
+            self._fetch_databases, max_age=2.0, refresh_after=0.5
+        )
     
     @staticmethod
     def _validate_database_name(name: str) -> None:
@@ -31,41 +65,48 @@ class DatabaseService:
         if not name:
             raise ValueError("Database name cannot be empty")
         
-        if not DatabaseService.DB_NAME_PATTERN.match(name):
+        # Only names as long as a system database can be one, so most names
+        # skip the lower-cased copy
+        if (len(name) in DatabaseService._SYSTEM_DATABASE_LENGTHS
+                and name.lower() in DatabaseService.SYSTEM_DATABASES):
+            raise ValueError(f"Cannot modify system database: {name}")
+        
+        if not _is_valid_name(name):
             raise ValueError(
                 "Database name must contain only alphanumeric characters and underscores, "
                 "and be between 1 and 64 characters long"
             )
-        
-        if name.lower() in DatabaseService.SYSTEM_DATABASES:
-            raise ValueError(f"Cannot modify system database: {name}")
     
     async def list_databases(self) -> List[str]:
         """
         List all databases on the MySQL server.
         
+        The result may be up to two seconds old, except that databases
+        created or dropped through this service are reflected immediately.
+        
         Returns:
             List[str]: List of database names
             
         Raises:
             Exception: If the query fails
         """
-        connection = None
         try:
-            connection = await db_manager.get_connection()
+            # Copy so callers can't mutate the cached list
+            return list(await self._databases_cache.get())
+        except Exception as e:
+            logger.error("Failed to list databases: %s", e)
+            raise
+    
+    async def _fetch_databases(self) -> List[str]:
+        """Run SHOW DATABASES and return the database names."""
+        async with db_manager.acquire() as connection:
             async with connection.cursor() as cursor:
                 await cursor.execute("SHOW DATABASES")
                 results = await cursor.fetchall()
                 # Extract database names from tuples
                 databases = [row[0] for row in results]
-                logger.info(f"Listed {len(databases)} databases")
+                logger.info("Listed %d databases", len(databases))
                 return databases
-        except Exception as e:
-            logger.error(f"Failed to list databases: {e}")
-            raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
     
     async def create_database(self, name: str) -> None:
         """
@@ -78,31 +119,28 @@ class DatabaseService:
             ValueError: If the database name is invalid
             Exception: If the database creation fails
         """
-        # Validate the database name
-        self._validate_database_name(name)
+        # Validate and quote the database name
+        quoted = _quote_database(name)
         
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            async with connection.cursor() as cursor:
-                # Use identifier quoting to prevent SQL injection
-                # Note: aiomysql doesn't support parameterized identifiers,
-                # so we validate the name and use string formatting
-                query = f"CREATE DATABASE `{name}`"
-                await cursor.execute(query)
-                logger.info(f"Created database: {name}")
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    # Use identifier quoting to prevent SQL injection
+                    # Note: aiomysql doesn't support parameterized identifiers,
+                    # so we validate the name and use string formatting
+                    await cursor.execute(_CREATE_DB_SQL(quoted))
+                    result_cache.invalidate_database(name)
+                    self._databases_cache.invalidate()
+                    logger.info("Created database: %s", name)
         except aiomysql.Error as e:
-            # Check for duplicate database error (error code 1007)
-            if e.args[0] == 1007:
-                raise ValueError(f"Database '{name}' already exists")
-            logger.error(f"Failed to create database '{name}': {e}")
+            message = _CREATE_ERRORS.get(e.args[0])
+            if message is not None:
+                raise ValueError(message(name))
+            logger.error("Failed to create database '%s': %s", name, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to create database '{name}': {e}")
+            logger.error("Failed to create database '%s': %s", name, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
     
     async def drop_database(self, name: str) -> None:
         """
@@ -115,29 +153,27 @@ class DatabaseService:
             ValueError: If the database name is invalid or is a system database
             Exception: If the database deletion fails
         """
-        # Validate the database name
-        self._validate_database_name(name)
+        # Validate and quote the database name
+        quoted = _quote_database(name)
         
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            async with connection.cursor() as cursor:
-                # Use identifier quoting to prevent SQL injection
-                query = f"DROP DATABASE `{name}`"
-                await cursor.execute(query)
-                logger.info(f"Dropped database: {name}")
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    # Use identifier quoting to prevent SQL injection
+                    await cursor.execute(_DROP_DB_SQL(quoted))
+                    result_cache.invalidate_database(name)
+                    table_service.invalidate_columns(name)
+                    self._databases_cache.invalidate()
+                    logger.info("Dropped database: %s", name)
         except aiomysql.Error as e:
-            # Check for database doesn't exist error (error code 1008)
-            if e.args[0] == 1008:
-                raise ValueError(f"Database '{name}' does not exist")
-            logger.error(f"Failed to drop database '{name}': {e}")
+            message = _DROP_ERRORS.get(e.args[0])
+            if message is not None:
+                raise ValueError(message(name))
+            logger.error("Failed to drop database '%s': %s", name, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to drop database '{name}': {e}")
+            logger.error("Failed to drop database '%s': %s", name, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
     
     async def get_database_ddl(self, name: str) -> str:
         """
@@ -154,50 +190,68 @@ class DatabaseService:
             ValueError: If the database doesn't exist
             Exception: If the DDL retrieval fails
         """
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            
-            # First, verify the database exists
-            async with connection.cursor() as cursor:
-                await cursor.execute("SHOW DATABASES")
-                databases = [row[0] for row in await cursor.fetchall()]
-                if name not in databases:
-                    raise ValueError(f"Database '{name}' does not exist")
-            
-            # Get all tables in the database
-            async with connection.cursor() as cursor:
-                await cursor.execute(f"SHOW TABLES FROM `{name}`")
-                tables = [row[0] for row in await cursor.fetchall()]
-            
-            # Build DDL string
-            ddl_parts = [f"-- Database: {name}\n"]
-            ddl_parts.append(f"CREATE DATABASE IF NOT EXISTS `{name}`;\n")
-            ddl_parts.append(f"USE `{name}`;\n\n")
-            
-            # Get CREATE TABLE statement for each table
-            for table in tables:
+            async with db_manager.acquire() as connection:
+                # One catalog query both verifies the database exists (a
+                # SCHEMATA row) and lists its tables (NULL when it has none)
                 async with connection.cursor() as cursor:
-                    await cursor.execute(f"SHOW CREATE TABLE `{name}`.`{table}`")
-                    result = await cursor.fetchone()
-                    if result:
-                        create_statement = result[1]
-                        ddl_parts.append(f"-- Table: {table}\n")
-                        ddl_parts.append(f"{create_statement};\n\n")
-            
+                    await cursor.execute(
+                        "SELECT t.TABLE_NAME FROM information_schema.SCHEMATA s "
+                        "LEFT JOIN information_schema.TABLES t ON t.TABLE_SCHEMA = s.SCHEMA_NAME "
+                        "WHERE s.SCHEMA_NAME = %s ORDER BY t.TABLE_NAME",
+                        (name,)
+                    )
+                    rows = await cursor.fetchall()
+            if not rows:
+                raise ValueError(f"Database '{name}' does not exist")
+            tables = [row[0] for row in rows if row[0] is not None]
+
+            # Build DDL string: one header part, then one part per table
+            ddl_parts = [_DDL_HEADER(name)]
+
+            if tables:
+                # Send every SHOW CREATE TABLE in one round-trip on a
+                # multi-statement connection and read the results in order.
+                # Names come from the catalog; doubling backticks keeps one
+                # that contains a backtick from ending its quoted identifier.
+                quoted_db = name.replace('`', '``')
+                sql = ";".join(
+                    f"SHOW CREATE TABLE `{quoted_db}`.`{table.replace('`', '``')}`" for table in tables
+                )
+                async with db_manager.acquire(multi_statements=True) as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(sql)
+                        for table in tables:
+                            result = await cursor.fetchone()
+                            if result:
+                                ddl_parts.append(f"-- Table: {table}\n{result[1]};\n\n")
+                            await cursor.nextset()
+
             ddl = "".join(ddl_parts)
-            logger.info(f"Retrieved DDL for database: {name}")
+            logger.info("Retrieved DDL for database: %s", name)
             return ddl
             
         except ValueError:
             # Re-raise ValueError as-is
             raise
         except Exception as e:
-            logger.error(f"Failed to get DDL for database '{name}': {e}")
+            logger.error("Failed to get DDL for database '%s': %s", name, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
+
+
+@lru_cache(maxsize=1024)
+def _quote_database(name: str) -> str:
+    """
+    Validate a database name and return it backtick-quoted.
+    
+    Results are cached per name, so repeated create/drop calls for the same
+    database skip revalidation. Invalid names raise and are not cached.
+    
+    Raises:
+        ValueError: If the name is invalid or is a system database
+    """
+    DatabaseService._validate_database_name(name)
+    return f"`{name}`"
 
 
 # Global database service instance
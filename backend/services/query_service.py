@@ -1,49 +1,119 @@
 """Query service layer for SQL query execution."""
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal, Optional, Sequence
 
 import aiomysql
 
 from backend.database import db_manager
 from backend.utils.logging_utils import logger
 
+# Statement kinds returned by QueryService.classify
+QueryKind = Literal['SELECT', 'SHOW', 'READ', 'DML', 'OTHER']
+
+# Result shapes: "objects" returns one dict per row under "rows"; "arrays"
+# returns the driver's row tuples under "rows" as they were fetched; "columns"
+# returns one list of values per column under "data". The last two never
+# build a dict per row or repeat the column names in every row.
+RowFormat = Literal['objects', 'arrays', 'columns']
+
 
 class QueryService:
     """Handles custom SQL query execution."""
 
-    # Pattern to identify SELECT queries (case-insensitive)
-    SELECT_PATTERN = re.compile(r'^\s*SELECT\s+', re.IGNORECASE)
+    # Leading keywords of statements that return rows without modifying data
+    READ_KEYWORDS = frozenset({'select', 'show', 'desc', 'describe', 'explain', 'with'})
+
+    # Leading keywords of DML statements
+    DML_KEYWORDS = frozenset({'insert', 'update', 'delete'})
+
+    # Longest keyword above; classification only ever looks at this many characters
+    _MAX_KEYWORD_LENGTH = 8
+
+    # Kinds whose statements return rows
+    READ_KINDS = frozenset({'SELECT', 'SHOW', 'READ'})
+
+    # Leading keyword -> kind, so classify() resolves a keyword with one lookup
+    _KEYWORD_KINDS: Dict[str, QueryKind] = {
+        'select': 'SELECT',
+        'show': 'SHOW',
+        **{keyword: 'DML' for keyword in DML_KEYWORDS},
+        **{keyword: 'READ' for keyword in READ_KEYWORDS - {'select', 'show'}},
+    }
 
-    # Pattern to identify DML statements (INSERT, UPDATE, DELETE)
-    DML_PATTERN = re.compile(r'^\s*(INSERT|UPDATE|DELETE)\s+', re.IGNORECASE)
+    # A WITH ... statement modifies data if its CTE feeds one of these
+    CTE_WRITE_PATTERN = re.compile(r'\b(?:INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
 
-    # Pattern to identify SHOW queries (case-insensitive)
-    SHOW_PATTERN = re.compile(r'^\s*SHOW\s+', re.IGNORECASE)
+    # Rows read from the server per fetch when collecting query results
+    FETCH_BATCH_SIZE = 1000
+
+    # Tokens that can contain a ';' without ending a statement (quoted strings
+    # and identifiers, comments), plus the statement separator itself
+    SCRIPT_TOKEN_PATTERN = re.compile(
+        r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|--[^\n]*|#[^\n]*|/\*.*?\*/|;""",
+        re.DOTALL
+    )
 
     @staticmethod
-    def _remove_comments(sql: str) -> str:
+    def _leading_keyword(sql: str) -> str:
         """
-        Remove SQL comments from the statement.
+        Return the lower-cased first word of the statement.
+        
+        Leading whitespace and ``--``, ``#`` and ``/* */`` comments are skipped
+        in a single forward scan, without building a comment-free copy of the
+        SQL. Only the first few characters of the word are inspected; words
+        longer than any keyword come back truncated and never match one.
         
         Args:
-            sql: SQL statement with possible comments
+            sql: SQL statement to inspect
             
         Returns:
-            str: SQL statement without comments
-        """
-        # Remove single-line comments (-- comment)
-        lines = sql.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Remove -- comments
-            comment_pos = line.find('--')
-            if comment_pos >= 0:
-                line = line[:comment_pos]
-            # Keep non-empty lines
-            if line.strip():
-                cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
+            str: Leading run of letters, lower-cased (empty if there is none)
+        """
+        i = 0
+        length = len(sql)
+        while i < length:
+            char = sql[i]
+            if char.isspace():
+                i += 1
+            elif char == '#' or sql.startswith('--', i):
+                i = sql.find('\n', i)
+                if i < 0:
+                    return ''
+            elif sql.startswith('/*', i):
+                i = sql.find('*/', i + 2)
+                if i < 0:
+                    return ''
+                i += 2
+            else:
+                break
+
+        head = sql[i:i + QueryService._MAX_KEYWORD_LENGTH + 1].lower()
+        for j, char in enumerate(head):
+            if not char.isalpha():
+                return head[:j]
+        return head
+
+    @staticmethod
+    def classify(sql: str) -> QueryKind:
+        """
+        Classify an SQL statement by its leading keyword.
+        
+        Callers that need more than one of the ``is_*`` answers should call
+        this once instead.
+        
+        Args:
+            sql: SQL statement to classify
+            
+        Returns:
+            QueryKind: "SELECT", "SHOW", "READ" (DESCRIBE, EXPLAIN or read-only
+            WITH), "DML" (INSERT, UPDATE, DELETE) or "OTHER"
+        """
+        keyword = QueryService._leading_keyword(sql)
+        kind = QueryService._KEYWORD_KINDS.get(keyword, 'OTHER')
+        # Only WITH needs a look past the first word
+        if keyword == 'with' and QueryService.CTE_WRITE_PATTERN.search(sql) is not None:
+            return 'OTHER'
+        return kind
 
     @staticmethod
     def is_select_query(sql: str) -> bool:
@@ -57,9 +127,21 @@ class QueryService:
         Returns:
             bool: True if it's a SELECT query, False otherwise
         """
-        # Remove comments before checking
-        cleaned_sql = QueryService._remove_comments(sql)
-        return bool(QueryService.SELECT_PATTERN.match(cleaned_sql))
+        return QueryService.classify(sql) == 'SELECT'
+
+    @staticmethod
+    def is_read_query(sql: str) -> bool:
+        """
+        Check if the SQL statement returns rows without modifying data.
+        Ignores SQL comments when checking.
+        
+        Args:
+            sql: SQL statement to check
+            
+        Returns:
+            bool: True if it's a SELECT, SHOW, DESCRIBE, EXPLAIN or read-only WITH query
+        """
+        return QueryService.classify(sql) in QueryService.READ_KINDS
 
     @staticmethod
     def is_dml_statement(sql: str) -> bool:
@@ -73,9 +155,7 @@ class QueryService:
         Returns:
             bool: True if it's a DML statement, False otherwise
         """
-        # Remove comments before checking
-        cleaned_sql = QueryService._remove_comments(sql)
-        return bool(QueryService.DML_PATTERN.match(cleaned_sql))
+        return QueryService.classify(sql) == 'DML'
 
     @staticmethod
     def is_show_query(sql: str) -> bool:
@@ -89,9 +169,39 @@ class QueryService:
         Returns:
             bool: True if it's a SHOW query, False otherwise
         """
-        # Remove comments before checking
-        cleaned_sql = QueryService._remove_comments(sql)
-        return bool(QueryService.SHOW_PATTERN.match(cleaned_sql))
+        return QueryService.classify(sql) == 'SHOW'
+
+    @staticmethod
+    def is_script(sql: str) -> bool:
+        """
+        Check if the SQL text contains more than one statement.
+        Semicolons inside quotes or comments, and a trailing semicolon, don't count.
+        
+        Args:
+            sql: SQL text to check
+            
+        Returns:
+            bool: True if it has two or more non-empty statements
+        """
+        statements = 0
+        has_content = False
+        position = 0
+        for match in QueryService.SCRIPT_TOKEN_PATTERN.finditer(sql):
+            if not has_content and sql[position:match.start()].strip():
+                has_content = True
+            token = match.group()
+            if token == ';':
+                if has_content:
+                    statements += 1
+                    if statements > 1:
+                        return True
+                has_content = False
+            elif token[0] in '\'"`':
+                has_content = True
+            position = match.end()
+        if sql[position:].strip():
+            has_content = True
+        return statements + has_content > 1
 
     @staticmethod
     def _validate_sql(sql: str) -> None:
@@ -104,21 +214,48 @@ class QueryService:
         Raises:
             ValueError: If the SQL is invalid
         """
-        if not sql or not sql.strip():
+        # isspace() checks in place; strip() would copy the whole statement
+        if not sql or sql.isspace():
             raise ValueError("SQL statement cannot be empty")
 
-    async def execute_query(self, sql: str) -> Dict[str, Any]:
+    @staticmethod
+    def _shape_rows(columns: List[str], rows: List[tuple], row_format: RowFormat) -> Dict[str, Any]:
+        """
+        Return fetched row tuples in the requested result shape.
+        
+        Args:
+            columns: Column names from the cursor description
+            rows: Row tuples as fetched
+            row_format: "objects", "arrays" or "columns" (see ``RowFormat``)
+            
+        Returns:
+            Dict with "columns" and either "rows" (list of dicts or of row
+            tuples) or "data" (one tuple per column)
+        """
+        # Tuples are left as they are: orjson writes them as JSON arrays
+        if row_format == 'columns':
+            data = list(zip(*rows)) if rows else [() for _ in columns]
+            return {"columns": columns, "data": data}
+        if row_format == 'arrays':
+            return {"columns": columns, "rows": list(rows)}
+        return {"columns": columns, "rows": [dict(zip(columns, row)) for row in rows]}
+
+    async def execute_query(self, sql: str, row_format: RowFormat = 'objects') -> Dict[str, Any]:
         """
         Execute a SELECT query and return results.
         
         Args:
             sql: SELECT SQL statement to execute
+            row_format: "objects" for a dict per row, "arrays" for an array
+                per row, "columns" for an array of values per column
             
         Returns:
             Dict containing:
                 - success: True if query succeeded
                 - columns: List of column names
-                - rows: List of row data as dicts
+                - rows: List of row data as dicts (row_format="objects") or
+                  as tuples (row_format="arrays")
+                - data: List of column value tuples (row_format="columns")
                 - error: None if successful
             
         Raises:
@@ -128,39 +265,45 @@ class QueryService:
         # Validate SQL
         self._validate_sql(sql)
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-
-            async with connection.cursor() as cursor:
-                await cursor.execute(sql)
-                results = await cursor.fetchall()
-
-                # Get column names from cursor description
-                columns = []
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-
-                # Convert rows to list of dicts
-                rows = []
-                for row in results:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        row_dict[columns[i]] = value
-                    rows.append(row_dict)
-
-                logger.info(f"Executed SELECT query, returned {len(rows)} rows")
-
-                return {
-                    "success": True,
-                    "columns": columns,
-                    "rows": rows,
-                    "error": None
-                }
+            async with db_manager.acquire() as connection:
+                # Server-side cursor: rows are read in batches and, for the
+                # default format, turned into dicts as they arrive, so the full
+                # result is never held both as tuples and as dicts. The other
+                # formats keep the tuples and leave them to the JSON encoder.
+                async with connection.cursor(aiomysql.SSCursor) as cursor:
+                    await cursor.execute(sql)
+
+                    # Get column names from cursor description
+                    columns = []
+                    if cursor.description:
+                        columns = [desc[0] for desc in cursor.description]
+
+                    rows = []
+                    if columns:
+                        while True:
+                            results = await cursor.fetchmany(self.FETCH_BATCH_SIZE)
+                            if not results:
+                                break
+                            if row_format == 'objects':
+                                rows.extend([dict(zip(columns, row)) for row in results])
+                            else:
+                                rows.extend(results)
+
+                    logger.info("Executed SELECT query, returned %d rows", len(rows))
+
+                    if row_format != 'objects':
+                        return {"success": True, **self._shape_rows(columns, rows, row_format), "error": None}
+                    return {
+                        "success": True,
+                        "columns": columns,
+                        "rows": rows,
+                        "error": None
+                    }
 
         except aiomysql.Error as e:
             error_msg = f"MySQL error: {e.args[1] if len(e.args) > 1 else str(e)}"
-            logger.error(f"Failed to execute query: {error_msg}")
+            logger.error("Failed to execute query: %s", error_msg)
             return {
                 "success": False,
                 "columns": None,
@@ -176,16 +319,25 @@ class QueryService:
                 "rows": None,
                 "error": error_msg
             }
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
 
-    async def execute_update(self, sql: str) -> Dict[str, Any]:
+    async def execute_update(
+        self,
+        sql: str,
+        params: Optional[Sequence[Sequence[Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Execute a DML/DDL statement and return affected row count.
         
+        With ``params`` the statement is run once per parameter row through
+        ``executemany``. The driver sends an ``INSERT ... VALUES`` statement
+        as a single multi-row INSERT, so a bulk load is one round-trip
+        instead of one per row. Literal ``%`` characters in such a statement
+        must be written as ``%%``.
+        
         Args:
-            sql: SQL statement to execute
+            sql: SQL statement to execute, with ``%s`` placeholders when
+                ``params`` is given
+            params: Parameter rows for a bulk execution; None runs ``sql`` once
             
         Returns:
             Dict containing:
@@ -194,30 +346,33 @@ class QueryService:
                 - error: None if successful
             
         Raises:
-            ValueError: If the SQL is empty
+            ValueError: If the SQL is empty or ``params`` has no rows
             Exception: If the statement execution fails
         """
         # Validate SQL
         self._validate_sql(sql)
+        if params is not None and not params:
+            raise ValueError("Parameter list cannot be empty")
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    if params is not None:
+                        affected_rows = await cursor.executemany(sql, params)
+                    else:
+                        affected_rows = await cursor.execute(sql)
+                    await connection.commit()  # Commit the transaction
+                    logger.info("Executed SQL statement, affected %s rows", affected_rows)
 
-            async with connection.cursor() as cursor:
-                affected_rows = await cursor.execute(sql)
-                await connection.commit()  # Commit the transaction
-                logger.info(f"Executed SQL statement, affected {affected_rows} rows")
-
-                return {
-                    "success": True,
-                    "affected_rows": affected_rows,
-                    "error": None
-                }
+                    return {
+                        "success": True,
+                        "affected_rows": affected_rows,
+                        "error": None
+                    }
 
         except aiomysql.Error as e:
             error_msg = f"MySQL error: {e.args[1] if len(e.args) > 1 else str(e)}"
-            logger.error(f"Failed to execute SQL statement: {error_msg}")
+            logger.error("Failed to execute SQL statement: %s", error_msg)
             return {
                 "success": False,
                 "affected_rows": None,
@@ -231,9 +386,72 @@ class QueryService:
                 "affected_rows": None,
                 "error": error_msg
             }
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
+
+
+    async def execute_script(self, sql: str, row_format: RowFormat = 'objects') -> Dict[str, Any]:
+        """
+        Execute several ``;``-separated statements in a single round-trip.
+        
+        The script is sent as one query on a multi-statement connection and
+        the result sets are read back in order. MySQL stops at the first
+        failing statement; results of the statements before it are kept.
+        
+        Args:
+            sql: SQL script to execute
+            row_format: Result shape for statements that return rows (see
+                ``execute_query``)
+            
+        Returns:
+            Dict containing:
+                - success: True if every statement succeeded
+                - results: One dict per executed statement, with either
+                  "columns" and "rows"/"data" or "affected_rows"
+                - error: None if successful
+            
+        Raises:
+            ValueError: If the SQL is empty
+        """
+        # Validate SQL
+        self._validate_sql(sql)
+
+        results: List[Dict[str, Any]] = []
+        try:
+            async with db_manager.acquire(multi_statements=True) as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(sql)
+                    while True:
+                        if cursor.description:
+                            columns = [desc[0] for desc in cursor.description]
+                            results.append(self._shape_rows(columns, await cursor.fetchall(), row_format))
+                        else:
+                            results.append({"affected_rows": cursor.rowcount})
+                        if not await cursor.nextset():
+                            break
+                    await connection.commit()
+                    logger.info("Executed SQL script with %d statements", len(results))
+
+                    return {
+                        "success": True,
+                        "results": results,
+                        "error": None
+                    }
+
+        except aiomysql.Error as e:
+            error_msg = f"MySQL error: {e.args[1] if len(e.args) > 1 else str(e)}"
+            logger.error("Failed to execute SQL script at statement %d: %s", len(results) + 1, error_msg)
+            return {
+                "success": False,
+                "results": results,
+                "error": error_msg
+            }
+        except Exception as e:
+            error_msg = f"SQL script execution failed: {str(e)}"
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "results": results,
+                "error": error_msg
+            }
 
 
 # Global query service instance
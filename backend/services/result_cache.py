@@ -0,0 +1,278 @@
+"""In-memory TTL cache for read-only query results."""
+import hashlib
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from backend.config import settings
+from backend.utils.logging_utils import logger
+
+# A (database, table) pair, lower-cased so differently cased spellings of the
+# same table share a tag
+TableTag = Tuple[str, str]
+
+_IDENTIFIER = r'(?:`([^`]+)`|(\w+))'
+
+# Any qualified `db`.`name` reference. This also matches things like
+# alias.column, which only causes extra invalidation, never a stale hit.
+_QUALIFIED_PATTERN = re.compile(_IDENTIFIER + r'\s*\.\s*' + _IDENTIFIER)
+
+# Identifier directly after a keyword that introduces a table reference
+_TABLE_POSITION_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+' + _IDENTIFIER + r'(\s*\.)?',
+    re.IGNORECASE
+)
+
+# Database-level statements (CREATE/DROP/ALTER DATABASE name)
+_DATABASE_STATEMENT_PATTERN = re.compile(
+    r'^\s*(?:CREATE|DROP|ALTER)\s+(?:DATABASE|SCHEMA)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?' + _IDENTIFIER,
+    re.IGNORECASE
+)
+
+# Schemas whose contents describe other tables; results reading from them
+# are invalidated by any write
+_CATALOG_SCHEMAS = frozenset({'information_schema', 'performance_schema', 'mysql', 'sys'})
+
+# Parts of a read statement that make its result depend on more than the
+# tables it reads, or give it side effects: INTO OUTFILE/DUMPFILE/@var,
+# locking reads, user variables, and time, random, lock, session and sleep
+# functions. Matches inside string literals only cost a cache miss.
+_UNCACHEABLE_PATTERN = re.compile(
+    r'\bINTO\b|\bFOR\s+(?:UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|@'
+    r'|\b(?:NOW|SYSDATE|CURDATE|CURTIME|UTC_DATE|UTC_TIME|UTC_TIMESTAMP|UNIX_TIMESTAMP'
+    r'|RAND|RANDOM_BYTES|UUID|UUID_SHORT|GET_LOCK|RELEASE_LOCK|RELEASE_ALL_LOCKS'
+    r'|IS_FREE_LOCK|IS_USED_LOCK|SLEEP|BENCHMARK|CONNECTION_ID|LAST_INSERT_ID'
+    r'|ROW_COUNT|FOUND_ROWS|NEXTVAL|LASTVAL)\s*\('
+    r'|\b(?:CURRENT_DATE|CURRENT_TIME|CURRENT_TIMESTAMP|LOCALTIME|LOCALTIMESTAMP)\b',
+    re.IGNORECASE
+)
+
+# SHOW statements that report live server state rather than schema
+_VOLATILE_SHOW_PATTERN = re.compile(r'\b(?:STATUS|PROCESSLIST|VARIABLES)\b', re.IGNORECASE)
+
+
+def is_cacheable(sql: str, kind: str) -> bool:
+    """
+    Return whether a read statement's result may be served from the cache.
+
+    Args:
+        sql: Statement classified as a read by ``QueryService.classify``
+        kind: Its kind ("SELECT", "SHOW" or "READ")
+
+    Returns:
+        False for statements that must run every time (see the patterns above)
+    """
+    if kind == 'SHOW' and _VOLATILE_SHOW_PATTERN.search(sql) is not None:
+        return False
+    return _UNCACHEABLE_PATTERN.search(sql) is None
+
+
+def referenced_tables(sql: str) -> Optional[Set[TableTag]]:
+    """
+    Extract the (database, table) pairs an SQL statement may touch.
+
+    Returns:
+        The set of tags, or None if the statement references a table that
+        cannot be resolved to a database (unqualified name) or reads the
+        server catalog, in which case callers must treat it as touching
+        everything.
+    """
+    for match in _TABLE_POSITION_PATTERN.finditer(sql):
+        if match.group(3) is None:
+            # Unqualified table name depends on the connection's default database
+            return None
+
+    tags = {
+        ((m.group(1) or m.group(2)).lower(), (m.group(3) or m.group(4)).lower())
+        for m in _QUALIFIED_PATTERN.finditer(sql)
+    }
+    if not tags or any(database in _CATALOG_SCHEMAS for database, _ in tags):
+        return None
+    return tags
+
+
+def referenced_database(sql: str) -> Optional[str]:
+    """Return the database named by a CREATE/DROP/ALTER DATABASE statement, if any."""
+    match = _DATABASE_STATEMENT_PATTERN.match(sql)
+    if match is None:
+        return None
+    return (match.group(1) or match.group(2)).lower()
+
+
+class ResultCache:
+    """
+    Read-through cache for SELECT/SHOW results keyed by a hash of the SQL text.
+
+    Each entry is tagged with the (database, table) pairs its statement reads,
+    so a write only evicts the entries for the tables it touches. Entries whose
+    tables cannot be determined are untagged and evicted by every write. The
+    short TTL remains the backstop for changes made indirectly (triggers,
+    cascading foreign keys, views) or by other clients.
+
+    A result whose computation overlapped an invalidation is returned but
+    not stored, since it may have been read before the write.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the ResultCache.
+
+        Args:
+            max_entries: Maximum number of cached results kept at once
+        """
+        self._max_entries = max_entries
+        # key -> (expires_at, result, tags); tags is None for untagged entries
+        self._entries: Dict[bytes, Tuple[float, Dict[str, Any], Optional[Set[TableTag]]]] = {}
+        # tag -> keys of the entries that read that table
+        self._tag_index: Dict[TableTag, Set[bytes]] = {}
+        # keys of entries that must be evicted on any write
+        self._untagged: Set[bytes] = set()
+        # Bumped by every invalidation so results computed across one aren't stored
+        self._generation = 0
+
+    @staticmethod
+    def make_key(sql: str, variant: str = "") -> bytes:
+        """Return the cache key for an SQL statement, distinct per result ``variant``."""
+        digest = hashlib.blake2b(sql.encode(), digest_size=16)
+        if variant:
+            digest.update(b"\0" + variant.encode())
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key`` if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._discard(key)
+            return None
+        return entry[1]
+
+    def set(
+        self,
+        key: bytes,
+        result: Dict[str, Any],
+        ttl: float,
+        tags: Optional[Set[TableTag]] = None
+    ) -> None:
+        """
+        Store ``result`` under ``key`` for ``ttl`` seconds.
+
+        Args:
+            key: Cache key from ``make_key``
+            result: Result to cache
+            ttl: Seconds to keep the result
+            tags: Tables the result was read from; None for unknown
+        """
+        if ttl <= 0 or self._max_entries <= 0:
+            return
+        self._discard(key)
+        if len(self._entries) >= self._max_entries:
+            # Evict the oldest insertion (dicts preserve insertion order)
+            self._discard(next(iter(self._entries)))
+
+        self._entries[key] = (time.monotonic() + ttl, result, tags)
+        if tags is None:
+            self._untagged.add(key)
+        else:
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+
+    def _discard(self, key: bytes) -> None:
+        """Remove an entry and its tag index references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        tags = entry[2]
+        if tags is None:
+            self._untagged.discard(key)
+            return
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _discard_untagged(self) -> None:
+        """Remove every entry whose tables are unknown."""
+        for key in list(self._untagged):
+            self._discard(key)
+
+    async def get_or_compute(
+        self,
+        key: bytes,
+        ttl: float,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        tags: Optional[Set[TableTag]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for ``key``, computing and caching it on a miss.
+
+        Only successful results (``result["success"]`` is truthy) are cached,
+        and only if no invalidation happened while ``compute`` ran.
+
+        Args:
+            key: Cache key from ``make_key``
+            ttl: Seconds to keep a freshly computed result
+            compute: Zero-argument coroutine factory producing the result
+            tags: Tables the statement reads; None for unknown
+        """
+        result = self.get(key)
+        if result is not None:
+            logger.debug("Result cache hit")
+            return result
+
+        generation = self._generation
+        result = await compute()
+        if result.get("success", False) and generation == self._generation:
+            self.set(key, result, ttl, tags)
+        return result
+
+    def invalidate_table(self, database: str, table: str) -> None:
+        """Evict entries that read ``database.table`` plus all untagged entries."""
+        self._generation += 1
+        keys = self._tag_index.get((database.lower(), table.lower()))
+        if keys:
+            for key in list(keys):
+                self._discard(key)
+        self._discard_untagged()
+
+    def invalidate_database(self, database: str) -> None:
+        """Evict entries that read any table of ``database`` plus all untagged entries."""
+        self._generation += 1
+        database = database.lower()
+        for tag in [tag for tag in self._tag_index if tag[0] == database]:
+            for key in list(self._tag_index.get(tag, ())):
+                self._discard(key)
+        self._discard_untagged()
+
+    def invalidate_statement(self, sql: str) -> None:
+        """
+        Evict the entries a write statement may have made stale.
+
+        Falls back to clearing the whole cache when the touched tables cannot
+        be determined.
+        """
+        database = referenced_database(sql)
+        if database is not None:
+            self.invalidate_database(database)
+            return
+
+        tags = referenced_tables(sql)
+        if tags is None:
+            self.clear()
+            return
+        for database, table in tags:
+            self.invalidate_table(database, table)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._generation += 1
+        self._entries.clear()
+        self._tag_index.clear()
+        self._untagged.clear()
+
+
+# Global result cache instance
+result_cache = ResultCache(max_entries=settings.query_cache_max_entries)
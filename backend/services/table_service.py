@@ -1,18 +1,94 @@
 """Table service layer for table-level operations."""
+import logging
 import re
-from typing import List, Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
 import aiomysql
 
+from backend.config import settings
 from backend.database import db_manager
+from backend.services.result_cache import result_cache
 from backend.utils.logging_utils import logger
 
+# Words in a filter condition that may be column names
+_IDENT_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
+
+# Substrings that must not appear anywhere in a filter condition, in any case
+_DANGEROUS_KEYWORDS = (
+    'DROP', 'DELETE', 'INSERT', 'UPDATE', 'CREATE', 'ALTER',
+    'TRUNCATE', 'EXEC', 'EXECUTE', 'UNION', '--', '/*', '*/',
+    'INFORMATION_SCHEMA', 'MYSQL', 'PERFORMANCE_SCHEMA'
+)
+# All of them as one case-insensitive alternation, so a condition is scanned
+# once rather than once per keyword, and without an upper-cased copy
+_DANGEROUS_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_KEYWORDS)), re.IGNORECASE)
+# The forbidden keywords without letters; the only ones a condition
+# with no letters at all can contain
+_DANGEROUS_SYMBOLS_RE = re.compile('|'.join(
+    re.escape(keyword) for keyword in _DANGEROUS_KEYWORDS if not any(c.isalpha() for c in keyword)
+))
+
+# SQL keywords and operators that are not column names (upper-case)
+_SQL_KEYWORDS = frozenset({
+    'AND', 'OR', 'NOT', 'IN', 'LIKE', 'BETWEEN', 'IS', 'NULL',
+    'TRUE', 'FALSE', 'ASC', 'DESC', 'LIMIT', 'OFFSET'
+})
+
+
+def _supports_window_functions(server_version: str) -> bool:
+    """Return whether a server version string is MySQL 8.0+ or MariaDB 10.2+."""
+    if 'MariaDB' in server_version:
+        # Older MariaDB releases report "5.5.5-<version>-MariaDB"
+        if server_version.startswith('5.5.5-'):
+            server_version = server_version[6:]
+        minimum = (10, 2)
+    else:
+        minimum = (8, 0)
+    version = tuple(int(part) for part in re.findall(r'\d+', server_version)[:2])
+    return version >= minimum
+
 
 class TableService:
     """Handles table-level operations."""
 
-    # Valid table name pattern: alphanumeric and underscore, 1-64 characters
-    TABLE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,64}$')
+    # Valid table name pattern: alphanumeric and underscore, 1-64 characters.
+    # Used with fullmatch, so it needs no anchors.
+    TABLE_NAME_PATTERN = re.compile(r'[a-zA-Z0-9_]{1,64}')
+
+    # Longest valid name; longer input is rejected before any regex or cache lookup
+    MAX_NAME_LENGTH = 64
+
+    # Upper bound on tables whose column metadata is cached at once
+    COLUMNS_CACHE_MAX_ENTRIES = 1024
+
+    # Largest page served by get_table_data / stream_table_data
+    MAX_PAGE_SIZE = 1000
+
+    def __init__(self):
+        """Initialize the TableService."""
+        # (database, table) -> (expires_at, columns) from SHOW COLUMNS
+        self._columns_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Whether page queries carry their total via COUNT(*) OVER ();
+        # decided on first use from the setting and the server version
+        self._window_count: Optional[bool] = None
+
+    def invalidate_columns(self, database: Optional[str] = None, table: Optional[str] = None) -> None:
+        """
+        Drop cached column metadata.
+        
+        Args:
+            database: Only drop entries for this database; None drops everything
+            table: Only drop the entry for this table of ``database``
+        """
+        if database is None:
+            self._columns_cache.clear()
+        elif table is not None:
+            self._columns_cache.pop((database, table), None)
+        else:
+            for key in [key for key in self._columns_cache if key[0] == database]:
+                del self._columns_cache[key]
 
     @staticmethod
     def _validate_table_name(name: str) -> None:
@@ -28,7 +104,7 @@ class TableService:
         if not name:
             raise ValueError("Table name cannot be empty")
 
-        if not TableService.TABLE_NAME_PATTERN.match(name):
+        if len(name) > TableService.MAX_NAME_LENGTH or not _is_valid_name(name):
             raise ValueError(
                 "Table name must contain only alphanumeric characters and underscores, "
                 "and be between 1 and 64 characters long"
@@ -49,12 +125,32 @@ class TableService:
             raise ValueError("Database name cannot be empty")
 
         # Use same pattern as table names for consistency
-        if not TableService.TABLE_NAME_PATTERN.match(name):
+        if len(name) > TableService.MAX_NAME_LENGTH or not _is_valid_name(name):
             raise ValueError(
                 "Database name must contain only alphanumeric characters and underscores, "
                 "and be between 1 and 64 characters long"
             )
 
+    @staticmethod
+    def _validate_pagination(page: int, page_size: int) -> None:
+        """
+        Validate that page and page_size are ints that can go into LIMIT/OFFSET.
+        
+        Args:
+            page: Page number (1-based)
+            page_size: Number of rows per page
+            
+        Raises:
+            ValueError: If either value is not an int or is out of range
+        """
+        # type() rather than isinstance(), so bools are rejected too
+        if type(page) is not int or page < 1:
+            raise ValueError("Page must be a positive integer")
+        if type(page_size) is not int or not 1 <= page_size <= TableService.MAX_PAGE_SIZE:
+            raise ValueError(
+                f"Page size must be an integer between 1 and {TableService.MAX_PAGE_SIZE}"
+            )
+
     async def list_tables(self, database: str) -> List[str]:
         """
         List all tables in a database.
@@ -71,29 +167,25 @@ class TableService:
         """
         self._validate_database_name(database)
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            async with connection.cursor() as cursor:
-                # Use SHOW TABLES to list tables in the database
-                await cursor.execute(f"SHOW TABLES FROM `{database}`")
-                results = await cursor.fetchall()
-                # Extract table names from tuples
-                tables = [row[0] for row in results]
-                logger.info(f"Listed {len(tables)} tables in database '{database}'")
-                return tables
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    # Use SHOW TABLES to list tables in the database
+                    await cursor.execute(f"SHOW TABLES FROM `{database}`")
+                    results = await cursor.fetchall()
+                    # Extract table names from tuples
+                    tables = [row[0] for row in results]
+                    logger.info("Listed %d tables in database '%s'", len(tables), database)
+                    return tables
         except aiomysql.Error as e:
             # Check for database doesn't exist error (error code 1049)
             if e.args[0] == 1049:
                 raise ValueError(f"Database '{database}' does not exist")
-            logger.error(f"Failed to list tables in database '{database}': {e}")
+            logger.error("Failed to list tables in database '%s': %s", database, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to list tables in database '{database}': {e}")
+            logger.error("Failed to list tables in database '%s': %s", database, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
 
     async def drop_table(self, database: str, table: str) -> None:
         """
@@ -110,14 +202,15 @@ class TableService:
         self._validate_database_name(database)
         self._validate_table_name(table)
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            async with connection.cursor() as cursor:
-                # Use identifier quoting to prevent SQL injection
-                query = f"DROP TABLE `{database}`.`{table}`"
-                await cursor.execute(query)
-                logger.info(f"Dropped table '{table}' from database '{database}'")
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    # Use identifier quoting to prevent SQL injection
+                    query = f"DROP TABLE `{database}`.`{table}`"
+                    await cursor.execute(query)
+                    result_cache.invalidate_table(database, table)
+                    self.invalidate_columns(database, table)
+                    logger.info("Dropped table '%s' from database '%s'", table, database)
         except aiomysql.Error as e:
             # Check for table doesn't exist error (error code 1051)
             if e.args[0] == 1051:
@@ -125,14 +218,11 @@ class TableService:
             # Check for database doesn't exist error (error code 1049)
             if e.args[0] == 1049:
                 raise ValueError(f"Database '{database}' does not exist")
-            logger.error(f"Failed to drop table '{table}' from database '{database}': {e}")
+            logger.error("Failed to drop table '%s' from database '%s': %s", table, database, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to drop table '{table}' from database '{database}': {e}")
+            logger.error("Failed to drop table '%s' from database '%s': %s", table, database, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
 
     def _parse_filter_condition(
             self,
@@ -166,38 +256,33 @@ class TableService:
         # 2. Validate that identifiers that look like column names exist in the table
         # 3. Let MySQL handle the actual parsing and parameter binding
 
-        # Convert to uppercase for keyword checking
-        condition_upper = filter_condition.upper()
-
-        # Check for dangerous SQL keywords that shouldn't appear in a WHERE clause
-        dangerous_keywords = [
-            'DROP', 'DELETE', 'INSERT', 'UPDATE', 'CREATE', 'ALTER',
-            'TRUNCATE', 'EXEC', 'EXECUTE', 'UNION', '--', '/*', '*/',
-            'INFORMATION_SCHEMA', 'MYSQL', 'PERFORMANCE_SCHEMA'
-        ]
-
-        for keyword in dangerous_keywords:
-            if keyword in condition_upper:
+        # Fast path for pure-literal conditions such as "1 = 1": with no
+        # letters there are no keywords or identifiers, only comment markers
+        if filter_condition.isascii() and not any(c.isalpha() for c in filter_condition):
+            match = _DANGEROUS_SYMBOLS_RE.search(filter_condition)
+            if match is not None:
                 raise ValueError(
-                    f"Invalid filter condition: contains forbidden keyword '{keyword}'"
+                    f"Invalid filter condition: contains forbidden keyword '{match.group()}'"
                 )
+            return filter_condition, []
+
+        # Check for dangerous SQL keywords that shouldn't appear in a WHERE clause
+        match = _DANGEROUS_RE.search(filter_condition)
+        if match is not None:
+            raise ValueError(
+                f"Invalid filter condition: contains forbidden keyword '{match.group().upper()}'"
+            )
 
         # Extract potential column names (simple heuristic: words before operators)
         # This is a basic validation - MySQL will do the final validation
-        import re
-        # Match word characters that could be column names
-        potential_columns = re.findall(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b', filter_condition)
-
-        # Filter out SQL keywords and operators
-        sql_keywords = {
-            'AND', 'OR', 'NOT', 'IN', 'LIKE', 'BETWEEN', 'IS', 'NULL',
-            'TRUE', 'FALSE', 'ASC', 'DESC', 'LIMIT', 'OFFSET'
-        }
+        potential_columns = _IDENT_RE.findall(filter_condition)
+        valid_column_set = frozenset(valid_columns)
 
         for potential_col in potential_columns:
-            if potential_col.upper() not in sql_keywords:
+            # Filter out SQL keywords and operators
+            if potential_col.upper() not in _SQL_KEYWORDS:
                 # Check if this looks like a column name and validate it exists
-                if potential_col not in valid_columns:
+                if potential_col not in valid_column_set:
                     # It might be a value, not a column - that's okay
                     # We'll let MySQL validate the final query
                     pass
@@ -206,6 +291,86 @@ class TableService:
         # dangerous patterns. MySQL will handle the actual execution safely.
         return filter_condition, []
 
+    def _counts_with_window(self, connection: aiomysql.Connection) -> bool:
+        """
+        Return whether page queries should carry their total via ``COUNT(*) OVER ()``.
+
+        Off unless ``table_data_window_count`` is set: the window makes the
+        server build every filtered row before LIMIT, which can cost more than
+        the separate COUNT(*) it saves. Checked once per process.
+        """
+        if self._window_count is None:
+            self._window_count = (
+                settings.table_data_window_count
+                and _supports_window_functions(connection.get_server_info())
+            )
+        return self._window_count
+
+    async def _prepare_table_data(
+            self,
+            connection: aiomysql.Connection,
+            database: str,
+            table: str,
+            filter_condition: Optional[str],
+            cursor: Optional[aiomysql.Cursor] = None
+    ) -> Tuple[List[Dict[str, Any]], str, List[Any]]:
+        """
+        Fetch the column info and build the FROM/WHERE part of the page queries.
+        
+        Args:
+            connection: Database connection to use
+            database: Name of the database
+            table: Name of the table
+            filter_condition: Optional WHERE clause condition (without the WHERE keyword)
+            cursor: Open cursor to run the column lookup on, if any
+            
+        Returns:
+            Tuple of (columns, row source clause, query params)
+        """
+        # First, get the table structure to know column names
+        columns = await self._get_columns_internal(connection, database, table, cursor)
+
+        source = f"FROM `{database}`.`{table}`"
+        params = []
+
+        if filter_condition:
+            # Parse and validate the filter condition
+            sanitized_condition, params = self._parse_filter_condition(
+                filter_condition,
+                [col['name'] for col in columns]
+            )
+
+            if sanitized_condition:
+                # Add WHERE clause with the validated condition
+                source += f" WHERE {sanitized_condition}"
+
+        return columns, source, params
+
+    @staticmethod
+    def _page_query(source: str, page: int, page_size: int, with_total: bool) -> str:
+        """
+        Build the paginated SELECT.
+        
+        With ``with_total`` every row carries the filtered row count as an extra
+        last value, so the page and its total come back in one round-trip.
+        
+        LIMIT and OFFSET are written into the SQL rather than bound, because
+        binding any value would make the driver %-format the whole statement
+        and break filters such as ``name LIKE '%John%'``. Callers check them
+        with ``_validate_pagination`` first.
+        """
+        # Calculate pagination
+        offset = (page - 1) * page_size
+        select = "SELECT *, COUNT(*) OVER ()" if with_total else "SELECT *"
+        return f"{select} {source} LIMIT {page_size} OFFSET {offset}"
+
+    @staticmethod
+    async def _count_rows(cursor: aiomysql.Cursor, source: str, params: List[Any]) -> int:
+        """Run a separate COUNT(*) over the page query's row source."""
+        # No args at all without params, so '%' in a filter isn't taken as a placeholder
+        await cursor.execute(f"SELECT COUNT(*) {source}", params or None)
+        return (await cursor.fetchone())[0]
+
     async def get_table_data(
             self,
             database: str,
@@ -240,81 +405,54 @@ class TableService:
         """
         self._validate_database_name(database)
         self._validate_table_name(table)
+        self._validate_pagination(page, page_size)
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-
-            # First, get the table structure to know column names
-            columns = await self._get_columns_internal(connection, database, table)
-            column_names = [col['name'] for col in columns]
-
-            # Build the base query for counting total rows
-            count_query = f"SELECT COUNT(*) FROM `{database}`.`{table}`"
-            params = []
-
-            if filter_condition:
-                # Parse and validate the filter condition
-                sanitized_condition, params = self._parse_filter_condition(
-                    filter_condition,
-                    column_names
-                )
-
-                if sanitized_condition:
-                    # Add WHERE clause with the validated condition
-                    count_query += f" WHERE {sanitized_condition}"
-
-            async with connection.cursor() as cursor:
-                # First, get the total count
-                if params:
-                    await cursor.execute(count_query, params)
-                else:
-                    await cursor.execute(count_query)
-
-                total_count = (await cursor.fetchone())[0]
-
-                # Calculate pagination
-                total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
-                offset = (page - 1) * page_size
-
-                # Build the SELECT query with pagination
-                query = f"SELECT * FROM `{database}`.`{table}`"
-
-                if filter_condition and sanitized_condition:
-                    query += f" WHERE {sanitized_condition}"
-
-                # Add LIMIT and OFFSET for pagination
-                query += f" LIMIT {page_size} OFFSET {offset}"
-
-                # Execute the paginated query
-                if params:
-                    await cursor.execute(query, params)
-                else:
-                    await cursor.execute(query)
-
-                results = await cursor.fetchall()
-
-                # Convert rows to list of dicts
-                rows = []
-                for row in results:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        row_dict[column_names[i]] = value
-                    rows.append(row_dict)
-
-                logger.info(
-                    f"Retrieved {len(rows)} rows (page {page}/{total_pages}) from table '{database}.{table}'"
-                    + (f" with filter: {filter_condition}" if filter_condition else "")
-                )
-
-                return {
-                    "columns": columns,
-                    "rows": rows,
-                    "total": total_count,
-                    "page": page,
-                    "page_size": page_size,
-                    "total_pages": total_pages
-                }
+            async with db_manager.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    # The column lookup, page query and any COUNT share this cursor
+                    columns, source, params = await self._prepare_table_data(
+                        connection, database, table, filter_condition, cursor
+                    )
+                    with_total = self._counts_with_window(connection)
+
+                    # Execute the paginated query
+                    await cursor.execute(self._page_query(source, page, page_size, with_total), params or None)
+                    results = await cursor.fetchall()
+
+                    # Convert rows to list of dicts; zip pairs names with values in C.
+                    # Names come from the result itself, so cached column
+                    # metadata can never misalign them. Without a name for the
+                    # trailing total, zip stops before it.
+                    result_names = [desc[0] for desc in cursor.description]
+                    if with_total:
+                        result_names.pop()
+                    rows = [dict(zip(result_names, row)) for row in results]
+
+                    if with_total and results:
+                        total_count = results[0][-1]
+                    elif with_total and page == 1:
+                        total_count = 0
+                    else:
+                        # Older server, or a page past the end that carries no total
+                        total_count = await self._count_rows(cursor, source, params)
+                    total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
+
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Retrieved %d rows (page %d/%d) from table '%s.%s'%s",
+                            len(rows), page, total_pages, database, table,
+                            " with filter: " + filter_condition if filter_condition else ""
+                        )
+
+                    return {
+                        "columns": columns,
+                        "rows": rows,
+                        "total": total_count,
+                        "page": page,
+                        "page_size": page_size,
+                        "total_pages": total_pages
+                    }
 
         except aiomysql.Error as e:
             # Check for table doesn't exist error (error code 1146)
@@ -326,14 +464,116 @@ class TableService:
             # Check for SQL syntax error (error code 1064)
             if e.args[0] == 1064:
                 raise ValueError(f"Invalid filter syntax: {e.args[1]}")
-            logger.error(f"Failed to get data from table '{database}.{table}': {e}")
+            logger.error("Failed to get data from table '%s.%s': %s", database, table, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to get data from table '{database}.{table}': {e}")
+            logger.error("Failed to get data from table '%s.%s': %s", database, table, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
+
+    async def stream_table_data(
+            self,
+            database: str,
+            table: str,
+            filter_condition: Optional[str] = None,
+            page: int = 1,
+            page_size: int = 50,
+            batch_size: int = 100
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a page of table data without buffering the whole page.
+        
+        The first item yielded is the page metadata (the same dict as
+        ``get_table_data`` without "rows"); every following item is a list of
+        up to ``batch_size`` row dicts read from a server-side cursor. All
+        validation and MySQL errors are raised before the first item, so
+        callers can prime the generator to surface them. The pooled connection
+        is held until the generator is exhausted or closed.
+        
+        Raises:
+            ValueError: If the database or table name is invalid, or filter contains dangerous patterns
+            Exception: If the data retrieval fails
+        """
+        self._validate_database_name(database)
+        self._validate_table_name(table)
+        self._validate_pagination(page, page_size)
+
+        async with db_manager.acquire() as connection:
+            cursor = None
+            try:
+                columns, source, params = await self._prepare_table_data(
+                    connection, database, table, filter_condition
+                )
+                with_total = self._counts_with_window(connection)
+                if not with_total:
+                    # The count can't run once the unbuffered page query is open
+                    async with connection.cursor() as count_cursor:
+                        total_count = await self._count_rows(count_cursor, source, params)
+
+                # Unbuffered cursor: rows are read off the socket batch by batch.
+                # It is closed explicitly because closing drains the result set.
+                cursor = await connection.cursor(aiomysql.SSCursor)
+                await cursor.execute(self._page_query(source, page, page_size, with_total), params or None)
+
+                # Names come from the result itself (see get_table_data)
+                result_names = [desc[0] for desc in cursor.description]
+                if with_total:
+                    result_names.pop()
+                    # The first batch is read up front for the total it carries
+                    results = await cursor.fetchmany(batch_size)
+                    if results:
+                        total_count = results[0][-1]
+                    elif page == 1:
+                        total_count = 0
+                    else:
+                        # A page past the end carries no total; the result is
+                        # exhausted, so the connection is free for a COUNT(*)
+                        await cursor.close()
+                        async with connection.cursor() as count_cursor:
+                            total_count = await self._count_rows(count_cursor, source, params)
+                else:
+                    results = await cursor.fetchmany(batch_size)
+            except aiomysql.Error as e:
+                if cursor is not None:
+                    connection.close()
+                # Check for table doesn't exist error (error code 1146)
+                if e.args[0] == 1146:
+                    raise ValueError(f"Table '{table}' does not exist in database '{database}'")
+                # Check for database doesn't exist error (error code 1049)
+                if e.args[0] == 1049:
+                    raise ValueError(f"Database '{database}' does not exist")
+                # Check for SQL syntax error (error code 1064)
+                if e.args[0] == 1064:
+                    raise ValueError(f"Invalid filter syntax: {e.args[1]}")
+                logger.error("Failed to get data from table '%s.%s': %s", database, table, e)
+                raise
+
+            row_count = 0
+            try:
+                yield {
+                    "columns": columns,
+                    "total": total_count,
+                    "page": page,
+                    "page_size": page_size,
+                    "total_pages": (total_count + page_size - 1) // page_size
+                }
+
+                while results:
+                    row_count += len(results)
+                    yield [dict(zip(result_names, row)) for row in results]
+                    results = await cursor.fetchmany(batch_size)
+                await cursor.close()
+            except BaseException:
+                # The unread rest of the result set would poison the pooled
+                # connection, so drop it instead of draining it
+                connection.close()
+                raise
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Streamed %d rows (page %d) from table '%s.%s'%s",
+                    row_count, page, database, table,
+                    " with filter: " + filter_condition if filter_condition else ""
+                )
 
     async def get_table_structure(self, database: str, table: str) -> List[Dict[str, Any]]:
         """
@@ -359,35 +599,36 @@ class TableService:
         self._validate_database_name(database)
         self._validate_table_name(table)
 
-        connection = None
         try:
-            connection = await db_manager.get_connection()
-            columns = await self._get_columns_internal(connection, database, table)
-            logger.info(f"Retrieved structure for table '{database}.{table}'")
-            return columns
+            async with db_manager.acquire() as connection:
+                columns = await self._get_columns_internal(connection, database, table)
+                logger.info("Retrieved structure for table '%s.%s'", database, table)
+                return columns
         except ValueError:
             # Re-raise ValueError as-is
             raise
         except Exception as e:
-            logger.error(f"Failed to get structure for table '{database}.{table}': {e}")
+            logger.error("Failed to get structure for table '%s.%s': %s", database, table, e)
             raise
-        finally:
-            if connection:
-                await db_manager.release_connection(connection)
 
     async def _get_columns_internal(
             self,
             connection: aiomysql.Connection,
             database: str,
-            table: str
+            table: str,
+            cursor: Optional[aiomysql.Cursor] = None
     ) -> List[Dict[str, Any]]:
         """
         Internal method to get column information using an existing connection.
         
+        Results are cached per table for ``settings.table_columns_cache_ttl``
+        seconds, so paging through a table doesn't repeat SHOW COLUMNS.
+        
         Args:
             connection: Database connection to use
             database: Name of the database
             table: Name of the table
+            cursor: Open cursor to run SHOW COLUMNS on; a new one is opened if None
             
         Returns:
             List of dicts containing column information
@@ -396,27 +637,46 @@ class TableService:
             ValueError: If the table doesn't exist
             Exception: If the query fails
         """
-        async with connection.cursor() as cursor:
-            # Use DESCRIBE or SHOW COLUMNS to get table structure
-            await cursor.execute(f"SHOW COLUMNS FROM `{database}`.`{table}`")
-            results = await cursor.fetchall()
+        key = (database, table)
+        cached = self._columns_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
-            if not results:
-                raise ValueError(f"Table '{table}' does not exist in database '{database}'")
-
-            columns = []
-            for row in results:
-                # SHOW COLUMNS returns: Field, Type, Null, Key, Default, Extra
-                columns.append({
-                    "name": row[0],
-                    "type": row[1],
-                    "nullable": row[2] == "YES",
-                    "key": row[3],
-                    "default": row[4],
-                    "extra": row[5]
-                })
-
-            return columns
+        if cursor is None:
+            async with connection.cursor() as cursor:
+                return await self._get_columns_internal(connection, database, table, cursor)
+
+        # Use DESCRIBE or SHOW COLUMNS to get table structure
+        await cursor.execute(f"SHOW COLUMNS FROM `{database}`.`{table}`")
+        results = await cursor.fetchall()
+
+        if not results:
+            raise ValueError(f"Table '{table}' does not exist in database '{database}'")
+
+        columns = []
+        for row in results:
+            # SHOW COLUMNS returns: Field, Type, Null, Key, Default, Extra
+            columns.append({
+                "name": row[0],
+                "type": row[1],
+                "nullable": row[2] == "YES",
+                "key": row[3],
+                "default": row[4],
+                "extra": row[5]
+            })
+
+        ttl = settings.table_columns_cache_ttl
+        if ttl > 0:
+            if len(self._columns_cache) >= self.COLUMNS_CACHE_MAX_ENTRIES:
+                self._columns_cache.clear()
+            self._columns_cache[key] = (time.monotonic() + ttl, columns)
+        return columns
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_name(name: str) -> bool:
+    """Return whether ``name`` matches ``TABLE_NAME_PATTERN``; cached across requests."""
+    return TableService.TABLE_NAME_PATTERN.fullmatch(name) is not None
 
 
 # Global table service instance
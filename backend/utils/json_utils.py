@@ -0,0 +1,44 @@
+"""JSON serialization helpers for MySQL result values."""
+import base64
+import datetime
+import decimal
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+
+def json_default(value: Any) -> Any:
+    """
+    Convert values orjson cannot serialize natively.
+
+    Mirrors FastAPI's ``jsonable_encoder`` for the types aiomysql returns,
+    except that binary (BLOB/BINARY) values that are not valid UTF-8 are
+    base64-encoded instead of failing the whole response.
+    """
+    if isinstance(value, decimal.Decimal):
+        # Same rule as jsonable_encoder: integral decimals become ints
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return base64.b64encode(value).decode('ascii')
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return jsonable_encoder(value)
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize ``value`` to JSON bytes."""
+    return orjson.dumps(value, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class JSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes MySQL result values (Decimal, bytes, timedelta, SET)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,14 +1,15 @@
 import logging
+import os
 import sys
 from datetime import datetime
+from itertools import islice
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal, Optional, TextIO
 
-from backend.config import get_settings
+from backend.config import settings
 from backend.utils.singleton_utils import singleton
 
-settings = get_settings()
 LoginResult = Literal["success", "failed"]
 
 
@@ -87,6 +88,9 @@ class LoginLogger:
         """
         self.log_dir = Path(log_dir)
         self.log_file = self.log_dir / log_file
+        # Append handle, opened on the first logged attempt and kept open;
+        # line-buffered so every entry is on disk as soon as it is written
+        self._file: Optional[TextIO] = None
 
         # Create logs directory if it doesn't exist
         self._ensure_log_directory()
@@ -95,9 +99,9 @@ class LoginLogger:
         """Create logs directory if it doesn't exist."""
         try:
             self.log_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Login log directory ensured: {self.log_dir}")
+            logger.info("Login log directory ensured: %s", self.log_dir)
         except Exception as e:
-            logger.error(f"Failed to create log directory {self.log_dir}: {e}")
+            logger.error("Failed to create log directory %s: %s", self.log_dir, e)
 
     def log_login_attempt(self, ip: str, result: LoginResult):
         """
@@ -115,13 +119,46 @@ class LoginLogger:
             log_entry = f"{timestamp}   {ip}   {result}\n"
 
             # Append to log file
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
+            if self._file is None:
+                self._file = open(self.log_file, "a", encoding="utf-8", buffering=1)
+            self._file.write(log_entry)
 
-            logger.info(f"Login attempt logged: {ip} - {result}")
+            logger.info("Login attempt logged: %s - %s", ip, result)
 
         except Exception as e:
-            logger.error(f"Failed to log login attempt: {e}")
+            logger.error("Failed to log login attempt: %s", e)
+
+    def close(self):
+        """Close the log file handle; the next logged attempt reopens it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _iter_lines_reversed(self, block_size: int = 64 * 1024) -> Iterator[str]:
+        """
+        Yield the non-empty lines of the log file from last to first.
+
+        The file is read backwards in blocks, so callers that stop early
+        only read the tail of the file.
+
+        Args:
+            block_size: Bytes read per block
+        """
+        with open(self.log_file, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            # Start of the earliest line seen so far, possibly incomplete
+            head = b""
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                lines = (f.read(read_size) + head).split(b"\n")
+                head = lines[0]
+                for line in reversed(lines[1:]):
+                    if line:
+                        yield line.decode("utf-8")
+            if head:
+                yield head.decode("utf-8")
 
     def get_recent_logs(self, limit: int = 100) -> list:
         """
@@ -137,14 +174,11 @@ class LoginLogger:
             if not self.log_file.exists():
                 return []
 
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Return most recent entries first
-            return lines[-limit:][::-1]
+            # Most recent entries first, reading only the end of the file
+            return [line + "\n" for line in islice(self._iter_lines_reversed(), limit)]
 
         except Exception as e:
-            logger.error(f"Failed to read login logs: {e}")
+            logger.error("Failed to read login logs: %s", e)
             return []
 
     def get_failed_attempts(self, ip: str = None, hours: int = 24) -> int:
@@ -165,36 +199,37 @@ class LoginLogger:
             cutoff_time = datetime.now().timestamp() - (hours * 3600)
             failed_count = 0
 
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) >= 4:
-                        # Parse timestamp
-                        timestamp_str = f"{parts[0]} {parts[1]}"
-                        try:
-                            log_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-
-                            # Check if within time window
-                            if log_time.timestamp() < cutoff_time:
-                                continue
-
-                            # Check IP filter
-                            log_ip = parts[2]
-                            if ip and log_ip != ip:
-                                continue
-
-                            # Check if failed
-                            result = parts[3]
-                            if result == "failed":
-                                failed_count += 1
-
-                        except ValueError:
+            # Entries are appended in time order, so read from the end and
+            # stop at the first one older than the window
+            for line in self._iter_lines_reversed():
+                parts = line.split()
+                if len(parts) >= 4:
+                    # Parse timestamp
+                    timestamp_str = f"{parts[0]} {parts[1]}"
+                    try:
+                        log_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+
+                        # Check if within time window
+                        if log_time.timestamp() < cutoff_time:
+                            break
+
+                        # Check IP filter
+                        log_ip = parts[2]
+                        if ip and log_ip != ip:
                             continue
 
+                        # Check if failed
+                        result = parts[3]
+                        if result == "failed":
+                            failed_count += 1
+
+                    except ValueError:
+                        continue
+
             return failed_count
 
         except Exception as e:
-            logger.error(f"Failed to count failed attempts: {e}")
+            logger.error("Failed to count failed attempts: %s", e)
             return 0
 
 
@@ -1,17 +1,36 @@
 """Rate limiter for API endpoints."""
+import heapq
 import time
-from collections import defaultdict
-from typing import Dict, Tuple
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Tuple
 
 from backend.utils.logging_utils import logger
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter."""
+    """
+    Simple in-memory rate limiter.
+    
+    Each IP keeps a sliding window of attempt timestamps. Timestamps that fall
+    out of the window passed to a call are discarded by that call, so all
+    callers of one limiter should use the same window.
+    
+    Not thread-safe, and it doesn't need to be: every method is synchronous
+    and is only called from coroutines on the worker's event loop, so each
+    call runs to completion without interleaving, with or without a GIL.
+    Worker processes each have their own limiter.
+    """
+
+    # Attempts are kept at most this long, whatever the window
+    _RETENTION_SECONDS = 3600
 
     def __init__(self):
-        # Store: {ip: [(timestamp, count), ...]}
-        self._attempts: Dict[str, list] = defaultdict(list)
+        # Store: {ip: deque([timestamp, ...])}, oldest first; an attempt
+        # counted n times appears n times
+        self._attempts: Dict[str, Deque[float]] = defaultdict(deque)
+        # (expires_at, ip) per recorded attempt, earliest first; cleanup only
+        # visits the IPs whose attempts have expired
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._cleanup_interval = 300  # Clean up old entries every 5 minutes
         self._last_cleanup = time.time()
 
@@ -23,22 +42,31 @@ class RateLimiter:
         if current_time - self._last_cleanup < self._cleanup_interval:
             return
 
-        cutoff_time = current_time - 3600  # 1 hour ago
+        cutoff_time = current_time - self._RETENTION_SECONDS
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] <= current_time:
+            _, ip = heapq.heappop(heap)
+            attempts = self._attempts.get(ip)
+            if attempts is None:
+                # Already reset or removed via an earlier heap entry
+                continue
 
-        for ip in list(self._attempts.keys()):
             # Remove old attempts
-            self._attempts[ip] = [
-                (timestamp, count)
-                for timestamp, count in self._attempts[ip]
-                if timestamp > cutoff_time
-            ]
+            self._expire(attempts, cutoff_time)
 
             # Remove IP if no attempts left
-            if not self._attempts[ip]:
+            if not attempts:
                 del self._attempts[ip]
 
         self._last_cleanup = current_time
-        logger.info(f"Rate limiter cleanup completed. Active IPs: {len(self._attempts)}")
+        logger.info("Rate limiter cleanup completed. Active IPs: %d", len(self._attempts))
+
+    @staticmethod
+    def _expire(attempts: Deque[float], cutoff_time: float) -> None:
+        """Drop timestamps at or before ``cutoff_time`` from the front of ``attempts``."""
+        while attempts and attempts[0] <= cutoff_time:
+            attempts.popleft()
 
     def check_rate_limit(
             self,
@@ -59,47 +87,55 @@ class RateLimiter:
         """
         self._cleanup_old_entries()
 
-        current_time = time.time()
-        cutoff_time = current_time - window_seconds
+        attempts = self._attempts.get(ip)
+        if not attempts:
+            return True, 0, 0
 
-        # Get attempts within the time window
-        recent_attempts = [
-            (timestamp, count)
-            for timestamp, count in self._attempts[ip]
-            if timestamp > cutoff_time
-        ]
+        current_time = time.time()
 
-        # Calculate total attempts
-        total_attempts = sum(count for _, count in recent_attempts)
+        # Keep only attempts within the time window
+        self._expire(attempts, current_time - window_seconds)
+        total_attempts = len(attempts)
 
         # Check if limit exceeded
         if total_attempts >= max_attempts:
             # Calculate when the oldest attempt will expire
-            if recent_attempts:
-                oldest_timestamp = min(timestamp for timestamp, _ in recent_attempts)
-                seconds_until_reset = int(window_seconds - (current_time - oldest_timestamp)) + 1
+            if attempts:
+                seconds_until_reset = int(window_seconds - (current_time - attempts[0])) + 1
             else:
                 seconds_until_reset = 0
 
             logger.warning(
-                f"Rate limit exceeded for IP {ip}: "
-                f"{total_attempts}/{max_attempts} attempts in {window_seconds}s"
+                "Rate limit exceeded for IP %s: %d/%d attempts in %ds",
+                ip, total_attempts, max_attempts, window_seconds
             )
             return False, total_attempts, seconds_until_reset
 
         return True, total_attempts, 0
 
-    def record_attempt(self, ip: str, count: int = 1):
+    def record_attempt(self, ip: str, count: int = 1, window_seconds: int = 60) -> int:
         """
         Record an attempt for an IP.
         
         Args:
             ip: Client IP address
             count: Number of attempts to record (default: 1)
+            window_seconds: Time window in seconds used for the returned total
+            
+        Returns:
+            Number of attempts within the time window, including this one
         """
         current_time = time.time()
-        self._attempts[ip].append((current_time, count))
-        logger.debug(f"Recorded {count} attempt(s) for IP {ip}")
+        attempts = self._attempts[ip]
+        if count == 1:
+            attempts.append(current_time)
+        else:
+            attempts.extend([current_time] * count)
+        heapq.heappush(self._expiry_heap, (current_time + self._RETENTION_SECONDS, ip))
+        logger.debug("Recorded %d attempt(s) for IP %s", count, ip)
+
+        self._expire(attempts, current_time - window_seconds)
+        return len(attempts)
 
     def reset_ip(self, ip: str):
         """
@@ -110,7 +146,7 @@ class RateLimiter:
         """
         if ip in self._attempts:
             del self._attempts[ip]
-            logger.info(f"Reset rate limit for IP {ip}")
+            logger.info("Reset rate limit for IP %s", ip)
 
     def get_attempts(self, ip: str, window_seconds: int = 60) -> int:
         """
@@ -123,16 +159,12 @@ class RateLimiter:
         Returns:
             Number of attempts
         """
-        current_time = time.time()
-        cutoff_time = current_time - window_seconds
-
-        recent_attempts = [
-            count
-            for timestamp, count in self._attempts[ip]
-            if timestamp > cutoff_time
-        ]
+        attempts = self._attempts.get(ip)
+        if not attempts:
+            return 0
 
-        return sum(recent_attempts)
+        self._expire(attempts, time.time() - window_seconds)
+        return len(attempts)
 
 
 # Global rate limiter instance
@@ -0,0 +1,47 @@
+"""Coalesce identical concurrent async calls into one in-flight call."""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class Singleflight(Generic[T]):
+    """
+    Share one in-flight call between concurrent callers using the same key.
+
+    The first caller for a key starts the call; callers arriving before it
+    finishes await the same task and receive its result or exception. Nothing
+    is kept once the call completes, so this never serves stale data.
+    """
+
+    def __init__(self):
+        """Initialize the Singleflight group."""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of ``factory()``, sharing a running call for ``key``.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            factory: Zero-argument coroutine factory, only invoked if no call
+                for ``key`` is in flight
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded so one caller being cancelled (client disconnect) doesn't
+        # cancel the call for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished call so the next caller for ``key`` starts a new one."""
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
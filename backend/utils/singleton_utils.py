@@ -4,11 +4,17 @@ from threading import Lock
 def singleton(cls):
     instance = {}
     instance_lock = Lock()
+    missing = object()
 
     def wrapper(*args, **kwargs):
-        if cls not in instance:
+        # Lock-free once created; callers that race the first call re-check
+        # under the lock so only one of them creates the instance
+        obj = instance.get(cls, missing)
+        if obj is missing:
             with instance_lock:
-                instance[cls] = cls(*args, **kwargs)
-        return instance[cls]
+                obj = instance.get(cls, missing)
+                if obj is missing:
+                    obj = instance[cls] = cls(*args, **kwargs)
+        return obj
 
     return wrapper
@@ -0,0 +1,80 @@
+"""Single-value stale-while-revalidate cache for cheap polling endpoints."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+from backend.utils.logging_utils import logger
+
+T = TypeVar("T")
+
+
+class StaleWhileRevalidate(Generic[T]):
+    """
+    Cache one value produced by an async fetch function.
+
+    - Younger than ``refresh_after``: returned as-is.
+    - Between ``refresh_after`` and ``max_age``: returned immediately while a
+      single background task refreshes it.
+    - Older than ``max_age`` (or never fetched): callers wait for one shared
+      fetch, whose errors propagate to them.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[T]], max_age: float, refresh_after: float):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch: Zero-argument coroutine function producing the value
+            max_age: Seconds after which a cached value is no longer served
+            refresh_after: Seconds after which a background refresh starts
+        """
+        self._fetch = fetch
+        self._max_age = max_age
+        self._refresh_after = refresh_after
+        self._value: Optional[T] = None
+        self._fetched_at: Optional[float] = None
+        # Bumped by invalidate() so fetches started earlier don't store stale values
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get(self) -> T:
+        """Return the cached value, fetching or refreshing it as needed."""
+        fetched_at = self._fetched_at
+        if fetched_at is not None:
+            age = time.monotonic() - fetched_at
+            if age < self._max_age:
+                if age >= self._refresh_after and self._refresh_task is None:
+                    self._refresh_task = asyncio.create_task(self._refresh())
+                return self._value
+
+        async with self._lock:
+            # Another caller may have fetched while this one waited for the lock
+            if self._fetched_at is not None and time.monotonic() - self._fetched_at < self._max_age:
+                return self._value
+            return await self._load()
+
+    async def _load(self) -> T:
+        """Fetch the value and store it unless invalidated meanwhile."""
+        generation = self._generation
+        value = await self._fetch()
+        if generation == self._generation:
+            self._value = value
+            self._fetched_at = time.monotonic()
+        return value
+
+    async def _refresh(self) -> None:
+        """Background refresh; failures keep serving the current value until it expires."""
+        try:
+            async with self._lock:
+                await self._load()
+        except Exception as e:
+            logger.warning("Background cache refresh failed: %s", e)
+        finally:
+            self._refresh_task = None
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next get() fetches a fresh one."""
+        self._generation += 1
+        self._value = None
+        self._fetched_at = None
@@ -0,0 +1,11 @@
+-- Schema for the DataService tests. {database} and {table} are filled in
+-- by the schema fixture; the database name is per pytest-xdist worker.
+CREATE DATABASE IF NOT EXISTS `{database}`;
+CREATE TABLE IF NOT EXISTS `{database}`.`{table}` (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) UNIQUE,
+    age INT
+);
+-- Clear rows left by an aborted earlier run
+TRUNCATE TABLE `{database}`.`{table}`;
@@ -1,87 +1,187 @@
 """Tests for DataService class."""
+import asyncio
+import os
+from pathlib import Path
+import aiomysql
 import pytest
 import pytest_asyncio
+from backend.config import settings
 from backend.database import db_manager
 from backend.services.data_service import DataService
 
 
-@pytest_asyncio.fixture(scope="function")
+# One database per pytest-xdist worker, so workers never share rows
+TEST_DB = f"test_data_service_db_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+TEST_TABLE = "test_users"
+SCHEMA_FILE = Path(__file__).parent / "fixtures" / "schema.sql"
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def db_connection():
-    """Fixture to provide an initialized database connection."""
+    """Fixture to provide a database connection pool shared by the whole session."""
     await db_manager.initialize()
     yield
     await db_manager.close_pool()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_table(db_connection):
-    """Fixture to create a test database and table."""
-    connection = None
-    test_db = "test_data_service_db"
-    test_table = "test_users"
+# Server variables relaxed for the session when TEST_MYSQL_RELAX_DURABILITY=1
+RELAXED_DURABILITY = {
+    "innodb_flush_log_at_trx_commit": 2,
+    "sync_binlog": 0,
+}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def relaxed_durability(db_connection):
+    """
+    Fixture to trade durability for commit speed on a disposable test server.
+    
+    Opt-in, since SET GLOBAL needs SUPER (or SYSTEM_VARIABLES_ADMIN) and
+    affects the whole server; the previous values are restored at the end.
+    Under pytest-xdist only the first worker changes them, so no worker can
+    save another's relaxed values as the ones to restore.
+    """
+    if (os.environ.get("TEST_MYSQL_RELAX_DURABILITY") != "1"
+            or os.environ.get("PYTEST_XDIST_WORKER", "gw0") != "gw0"):
+        yield
+        return
+    
+    async with db_manager.acquire() as connection, connection.cursor() as cursor:
+        await cursor.execute(
+            "SELECT " + ", ".join(f"@@GLOBAL.{name}" for name in RELAXED_DURABILITY)
+        )
+        previous = dict(zip(RELAXED_DURABILITY, await cursor.fetchone()))
+        await cursor.execute(
+            "SET " + ", ".join(f"GLOBAL {name} = %s" for name in RELAXED_DURABILITY),
+            list(RELAXED_DURABILITY.values())
+        )
     
     try:
-        connection = await db_manager.get_connection()
-        async with connection.cursor() as cursor:
-            # Create test database
-            await cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{test_db}`")
-            
-            # Create test table
-            await cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS `{test_db}`.`{test_table}` (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) UNIQUE,
-                    age INT
-                )
-            """)
-            
-            # Clear any existing data
-            await cursor.execute(f"DELETE FROM `{test_db}`.`{test_table}`")
-        
-        yield (test_db, test_table)
-        
+        yield
+    finally:
+        async with db_manager.acquire() as connection, connection.cursor() as cursor:
+            await cursor.execute(
+                "SET " + ", ".join(f"GLOBAL {name} = %s" for name in previous),
+                list(previous.values())
+            )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def schema(db_connection, relaxed_durability):
+    """Fixture to create the test database and table once per session."""
+    # Run the whole schema script in one round-trip on a multi-statement connection
+    schema_sql = SCHEMA_FILE.read_text().format(database=TEST_DB, table=TEST_TABLE)
+    async with db_manager.acquire(multi_statements=True) as connection, connection.cursor() as cursor:
+        await cursor.execute(schema_sql)
+        while await cursor.nextset():
+            pass
+    
+    try:
+        yield (TEST_DB, TEST_TABLE)
     finally:
         # Cleanup
-        if connection:
-            async with connection.cursor() as cursor:
-                await cursor.execute(f"DROP DATABASE IF EXISTS `{test_db}`")
-            await db_manager.release_connection(connection)
+        async with db_manager.acquire() as connection, connection.cursor() as cursor:
+            await cursor.execute(f"DROP DATABASE IF EXISTS `{TEST_DB}`")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_table(schema):
+    """Fixture to provide the test table, emptied after each test."""
+    # The service writes through its own autocommit pool connections, so a
+    # transaction on this fixture's connection could not roll them back;
+    # the table is truncated instead, which also resets AUTO_INCREMENT.
+    test_db, test_table = schema
+    try:
+        yield schema
+    finally:
+        async with db_manager.acquire() as connection, connection.cursor() as cursor:
+            await cursor.execute(f"TRUNCATE TABLE `{test_db}`.`{test_table}`")
+
 
+@pytest.fixture(scope="session")
+def data_service():
+    """Fixture to provide one DataService, and its caches, for the whole session."""
+    return DataService()
 
-@pytest.mark.asyncio
-async def test_insert_row(test_table):
-    """Test inserting a row into a table."""
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def conn(test_table):
+    """Fixture to provide one connection for all of a test's verification queries."""
+    async with db_manager.acquire() as connection:
+        yield connection
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_crud_lifecycle(test_table, conn, data_service):
+    """Test inserting, updating and deleting one row in sequence."""
     test_db, test_table_name = test_table
-    service = DataService()
+    select_row = f"SELECT * FROM `{test_db}`.`{test_table_name}` WHERE id = %s"
     
     # Insert a row
+    data = {
+        "name": "Jane Doe",
+        "email": "jane@example.com",
+        "age": 25
+    }
+    row_id = await data_service.insert_row(test_db, test_table_name, data)
+    assert row_id is not None
+    
+    async with conn.cursor() as cursor:
+        # Verify the row was inserted
+        await cursor.execute(select_row, [row_id])
+        result = await cursor.fetchone()
+        assert result is not None
+        assert result[1] == "Jane Doe"  # name column
+        assert result[2] == "jane@example.com"  # email column
+        assert result[3] == 25  # age column
+        
+        # Update the row
+        update_data = {
+            "name": "Jane Smith",
+            "age": 26
+        }
+        await data_service.update_row(test_db, test_table_name, "id", row_id, update_data)
+        
+        # Verify the row was updated
+        await cursor.execute(select_row, [row_id])
+        result = await cursor.fetchone()
+        assert result is not None
+        assert result[1] == "Jane Smith"  # name was updated
+        assert result[2] == "jane@example.com"  # email unchanged
+        assert result[3] == 26  # age was updated
+        
+        # Delete the row
+        await data_service.delete_row(test_db, test_table_name, "id", row_id)
+        
+        # Verify the row was deleted
+        await cursor.execute(select_row, [row_id])
+        result = await cursor.fetchone()
+        assert result is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_insert_and_fetch(test_table, data_service):
+    """Test inserting a row and reading it back in one call."""
+    test_db, test_table_name = test_table
+    # Insert a row and read it back on the same connection
     data = {
         "name": "John Doe",
         "email": "john@example.com",
         "age": 30
     }
-    await service.insert_row(test_db, test_table_name, data)
+    row = await data_service.insert_and_fetch(test_db, test_table_name, data)
     
     # Verify the row was inserted
-    connection = await db_manager.get_connection()
-    try:
-        async with connection.cursor() as cursor:
-            await cursor.execute(f"SELECT * FROM `{test_db}`.`{test_table_name}` WHERE email = %s", ["john@example.com"])
-            result = await cursor.fetchone()
-            assert result is not None
-            assert result[1] == "John Doe"  # name column
-            assert result[2] == "john@example.com"  # email column
-            assert result[3] == 30  # age column
-    finally:
-        await db_manager.release_connection(connection)
+    assert row["id"] is not None
+    assert row["name"] == "John Doe"
+    assert row["email"] == "john@example.com"
+    assert row["age"] == 30
 
 
-@pytest.mark.asyncio
-async def test_insert_row_with_invalid_data(test_table):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_insert_row_with_invalid_data(test_table, data_service):
     """Test that inserting invalid data raises an error."""
     test_db, test_table_name = test_table
-    service = DataService()
     
     # Try to insert with missing required field (name is NOT NULL)
     data = {
@@ -90,141 +190,164 @@ async def test_insert_row_with_invalid_data(test_table):
     }
     
     with pytest.raises(ValueError, match="validation failed"):
-        await service.insert_row(test_db, test_table_name, data)
+        await data_service.insert_row(test_db, test_table_name, data)
+
+
+@pytest.mark.parametrize("name,identifier_type", [
+    ("test_table", "Table"),
+    ("TestTable123", "Table"),
+    ("_underscore", "Column"),
+])
+def test_validate_identifier(name, identifier_type, data_service):
+    """Test that valid identifiers pass validation."""
+    data_service._validate_identifier(name, identifier_type)
+
+
+@pytest.mark.parametrize("name,message", [
+    ("", "cannot be empty"),
+    ("test-table", "alphanumeric"),
+    ("test.table", "alphanumeric"),
+    ("test table", "alphanumeric"),
+])
+def test_validate_identifier_invalid(name, message, data_service):
+    """Test that invalid identifiers raise ValueError."""
+    with pytest.raises(ValueError) as excinfo:
+        data_service._validate_identifier(name, "Table")
+    assert message in str(excinfo.value)
 
 
-@pytest.mark.asyncio
-async def test_update_row(test_table):
-    """Test updating a row in a table."""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_insert_empty_data(data_service):
+    """Test that inserting empty data raises an error."""
+    # Rejected before any query, so no database or pool is needed
+    with pytest.raises(ValueError, match="Data cannot be empty"):
+        await data_service.insert_row(TEST_DB, TEST_TABLE, {})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_update_empty_data(data_service):
+    """Test that updating with empty data raises an error."""
+    # Rejected before any query, so no database or pool is needed
+    with pytest.raises(ValueError, match="Data cannot be empty"):
+        await data_service.update_row(TEST_DB, TEST_TABLE, "id", 1, {})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_insert_into_nonexistent_table(db_connection, data_service):
+    """Test that inserting into a non-existent table raises an error."""
+    data = {"name": "Test"}
+    with pytest.raises(ValueError, match="does not exist"):
+        await data_service.insert_row(TEST_DB, "nonexistent_table", data)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_inserts(test_table, conn, data_service):
+    """Test that concurrent inserts are all written, and get no ids when batched."""
     test_db, test_table_name = test_table
-    service = DataService()
-    
-    # First insert a row
-    data = {
-        "name": "Jane Doe",
-        "email": "jane@example.com",
-        "age": 25
-    }
-    await service.insert_row(test_db, test_table_name, data)
-    
-    # Get the inserted row's ID
-    connection = await db_manager.get_connection()
-    try:
-        async with connection.cursor() as cursor:
-            await cursor.execute(f"SELECT id FROM `{test_db}`.`{test_table_name}` WHERE email = %s", ["jane@example.com"])
-            result = await cursor.fetchone()
-            row_id = result[0]
-    finally:
-        await db_manager.release_connection(connection)
     
-    # Update the row
-    update_data = {
-        "name": "Jane Smith",
-        "age": 26
-    }
-    await service.update_row(test_db, test_table_name, "id", row_id, update_data)
+    # Submitted together, so they share one multi-row INSERT
+    emails = [f"user{i}@example.com" for i in range(5)]
+    row_ids = await asyncio.gather(*(
+        data_service.insert_row(test_db, test_table_name, {"name": f"User {i}", "email": email})
+        for i, email in enumerate(emails)
+    ))
     
-    # Verify the row was updated
-    connection = await db_manager.get_connection()
-    try:
-        async with connection.cursor() as cursor:
-            await cursor.execute(f"SELECT * FROM `{test_db}`.`{test_table_name}` WHERE id = %s", [row_id])
-            result = await cursor.fetchone()
-            assert result is not None
-            assert result[1] == "Jane Smith"  # name was updated
-            assert result[2] == "jane@example.com"  # email unchanged
-            assert result[3] == 26  # age was updated
-    finally:
-        await db_manager.release_connection(connection)
+    async with conn.cursor() as cursor:
+        await cursor.execute(f"SELECT email, id FROM `{test_db}`.`{test_table_name}`")
+        stored = dict(await cursor.fetchall())
+    assert sorted(stored) == sorted(emails)
+    if settings.insert_batch_max_rows > 1:
+        # One multi-row INSERT: its ids can't be mapped back to the rows
+        assert all(row_id is None for row_id in row_ids)
+    else:
+        assert row_ids == [stored[email] for email in emails]
 
 
-@pytest.mark.asyncio
-async def test_delete_row(test_table):
-    """Test deleting a row from a table."""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_failure_is_split_per_caller(test_table, conn, data_service):
+    """Test that one bad row in a batch fails only its own caller."""
     test_db, test_table_name = test_table
-    service = DataService()
+    await data_service.insert_row(test_db, test_table_name, {"name": "Taken", "email": "taken@example.com"})
     
-    # First insert a row
-    data = {
-        "name": "Bob Smith",
-        "email": "bob@example.com",
-        "age": 35
-    }
-    await service.insert_row(test_db, test_table_name, data)
+    emails = ["first@example.com", "taken@example.com", "last@example.com"]
+    results = await asyncio.gather(*(
+        data_service.insert_row(test_db, test_table_name, {"name": "Batched", "email": email})
+        for email in emails
+    ), return_exceptions=True)
     
-    # Get the inserted row's ID
-    connection = await db_manager.get_connection()
-    try:
-        async with connection.cursor() as cursor:
-            await cursor.execute(f"SELECT id FROM `{test_db}`.`{test_table_name}` WHERE email = %s", ["bob@example.com"])
-            result = await cursor.fetchone()
-            row_id = result[0]
-    finally:
-        await db_manager.release_connection(connection)
-    
-    # Delete the row
-    await service.delete_row(test_db, test_table_name, "id", row_id)
+    assert not isinstance(results[0], Exception)
+    assert isinstance(results[1], ValueError)
+    assert "validation failed" in str(results[1])
+    assert not isinstance(results[2], Exception)
     
-    # Verify the row was deleted
-    connection = await db_manager.get_connection()
-    try:
-        async with connection.cursor() as cursor:
-            await cursor.execute(f"SELECT * FROM `{test_db}`.`{test_table_name}` WHERE id = %s", [row_id])
-            result = await cursor.fetchone()
-            assert result is None
-    finally:
-        await db_manager.release_connection(connection)
+    async with conn.cursor() as cursor:
+        await cursor.execute(f"SELECT email FROM `{test_db}`.`{test_table_name}` WHERE name = %s", ["Batched"])
+        stored = sorted(row[0] for row in await cursor.fetchall())
+    assert stored == ["first@example.com", "last@example.com"]
 
 
-@pytest.mark.asyncio
-async def test_validate_identifier():
-    """Test identifier validation."""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_connection_error_is_not_retried(monkeypatch):
+    """Test that a failure unrelated to the rows fails every caller without retries."""
     service = DataService()
+    calls = []
     
-    # Valid identifiers should not raise
-    service._validate_identifier("test_table", "Table")
-    service._validate_identifier("TestTable123", "Table")
-    service._validate_identifier("_underscore", "Column")
-    
-    # Invalid identifiers should raise ValueError
-    with pytest.raises(ValueError, match="cannot be empty"):
-        service._validate_identifier("", "Table")
-    
-    with pytest.raises(ValueError, match="alphanumeric"):
-        service._validate_identifier("test-table", "Table")
+    async def failing_insert(database, table, columns, rows):
+        calls.append(len(rows))
+        raise RuntimeError("Timed out waiting for a database connection")
     
-    with pytest.raises(ValueError, match="alphanumeric"):
-        service._validate_identifier("test.table", "Table")
+    monkeypatch.setattr(service, "_execute_insert", failing_insert)
+    results = await asyncio.gather(*(
+        service.insert_row(TEST_DB, TEST_TABLE, {"name": f"User {i}"}) for i in range(3)
+    ), return_exceptions=True)
     
-    with pytest.raises(ValueError, match="alphanumeric"):
-        service._validate_identifier("test table", "Table")
+    assert calls == [3]
+    assert all(isinstance(result, RuntimeError) for result in results)
 
 
-@pytest.mark.asyncio
-async def test_insert_empty_data(test_table):
-    """Test that inserting empty data raises an error."""
-    test_db, test_table_name = test_table
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_on_non_transactional_table_is_not_retried(monkeypatch):
+    """Test that a row error on a non-transactional table fails the whole batch."""
     service = DataService()
+    calls = []
     
-    with pytest.raises(ValueError, match="Data cannot be empty"):
-        await service.insert_row(test_db, test_table_name, {})
-
-
-@pytest.mark.asyncio
-async def test_update_empty_data(test_table):
-    """Test that updating with empty data raises an error."""
-    test_db, test_table_name = test_table
-    service = DataService()
+    async def failing_insert(database, table, columns, rows):
+        calls.append(len(rows))
+        raise aiomysql.IntegrityError(1062, "Duplicate entry 'x' for key 'email'")
     
-    with pytest.raises(ValueError, match="Data cannot be empty"):
-        await service.update_row(test_db, test_table_name, "id", 1, {})
+    async def not_transactional(database, table):
+        return False
+    
+    monkeypatch.setattr(service, "_execute_insert", failing_insert)
+    monkeypatch.setattr(service, "_is_transactional", not_transactional)
+    results = await asyncio.gather(*(
+        service.insert_row(TEST_DB, TEST_TABLE, {"name": f"User {i}"}) for i in range(3)
+    ), return_exceptions=True)
+    
+    # Rows before the failing one may already be stored, so none are re-sent
+    assert calls == [3]
+    assert all(isinstance(result, ValueError) for result in results)
 
 
-@pytest.mark.asyncio
-async def test_insert_into_nonexistent_table(db_connection):
-    """Test that inserting into a non-existent table raises an error."""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cancelled_batch_cancels_its_callers(monkeypatch):
+    """Test that the callers of a batch whose flush is cancelled don't wait forever."""
     service = DataService()
+    started = asyncio.Event()
     
-    data = {"name": "Test"}
-    with pytest.raises(ValueError, match="does not exist"):
-        await service.insert_row("test_data_service_db", "nonexistent_table", data)
+    async def hanging_insert(database, table, columns, rows):
+        started.set()
+        await asyncio.Event().wait()
+    
+    monkeypatch.setattr(service, "_execute_insert", hanging_insert)
+    inserts = asyncio.gather(*(
+        service.insert_row(TEST_DB, TEST_TABLE, {"name": f"User {i}"}) for i in range(3)
+    ), return_exceptions=True)
+    await asyncio.wait_for(started.wait(), 1)
+    
+    # As at shutdown
+    for task in list(service._flush_tasks):
+        task.cancel()
+    results = await asyncio.wait_for(inserts, 1)
+    
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
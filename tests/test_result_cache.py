@@ -0,0 +1,178 @@
+"""Tests for the query result cache."""
+from types import SimpleNamespace
+import pytest
+from backend.services import result_cache as result_cache_module
+from backend.services.result_cache import ResultCache, is_cacheable, referenced_tables
+
+
+def _result(value):
+    return {"success": True, "columns": ["value"], "rows": [{"value": value}]}
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_runs_compute_once():
+    """Test that a repeated statement is served from the cache."""
+    cache = ResultCache(max_entries=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return _result(len(calls))
+
+    key = cache.make_key("SELECT * FROM `db`.`t`")
+    first = await cache.get_or_compute(key, 60, compute, tags={("db", "t")})
+    second = await cache.get_or_compute(key, 60, compute, tags={("db", "t")})
+
+    assert first == second == _result(1)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_results_are_not_cached():
+    """Test that an unsuccessful result is computed again next time."""
+    cache = ResultCache(max_entries=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"success": False, "error": "boom"}
+
+    key = cache.make_key("SELECT 1")
+    await cache.get_or_compute(key, 60, compute)
+    await cache.get_or_compute(key, 60, compute)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_result_computed_across_invalidation_is_not_cached():
+    """Test that a read overlapping a write to its table is not cached."""
+    cache = ResultCache(max_entries=10)
+    key = cache.make_key("SELECT * FROM `db`.`t`")
+
+    async def compute():
+        # The write lands while the read is in flight
+        cache.invalidate_table("db", "t")
+        return _result(1)
+
+    assert await cache.get_or_compute(key, 60, compute, tags={("db", "t")}) == _result(1)
+    assert cache.get(key) is None
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    """Test that an entry is not returned after its TTL."""
+    cache = ResultCache(max_entries=10)
+    now = [100.0]
+    monkeypatch.setattr(result_cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    key = cache.make_key("SELECT 1")
+    cache.set(key, _result(1), ttl=5)
+    assert cache.get(key) == _result(1)
+
+    now[0] += 5
+    assert cache.get(key) is None
+
+
+def test_make_key_differs_per_variant():
+    """Test that the same SQL in different row formats gets different keys."""
+    assert ResultCache.make_key("SELECT 1") != ResultCache.make_key("SELECT 1", "arrays")
+    assert ResultCache.make_key("SELECT 1", "arrays") != ResultCache.make_key("SELECT 1", "columns")
+
+
+def test_oldest_entry_is_evicted_when_full():
+    """Test that the cache never holds more than max_entries results."""
+    cache = ResultCache(max_entries=2)
+    keys = [cache.make_key(f"SELECT {i}") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.set(key, _result(i), ttl=60)
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == _result(1)
+    assert cache.get(keys[2]) == _result(2)
+
+
+def test_clear_drops_every_entry():
+    """Test that a write through clear() evicts all cached results."""
+    cache = ResultCache(max_entries=10)
+    key = cache.make_key("SELECT * FROM `db`.`users`")
+    cache.set(key, _result(1), ttl=60)
+
+    cache.clear()
+
+    assert cache.get(key) is None
+
+
+def test_invalidate_table_evicts_only_matching_and_untagged():
+    """Test that a write evicts the entries of its table and every untagged entry."""
+    cache = ResultCache(max_entries=10)
+    users = cache.make_key("SELECT * FROM `db`.`users`")
+    orders = cache.make_key("SELECT * FROM `db`.`orders`")
+    unknown = cache.make_key("SELECT * FROM users")
+    cache.set(users, _result("users"), ttl=60, tags={("db", "users")})
+    cache.set(orders, _result("orders"), ttl=60, tags={("db", "orders")})
+    cache.set(unknown, _result("unknown"), ttl=60, tags=None)
+
+    cache.invalidate_table("DB", "Users")
+
+    assert cache.get(users) is None
+    assert cache.get(unknown) is None
+    assert cache.get(orders) == _result("orders")
+
+
+def test_invalidate_statement_clears_everything_for_unknown_tables():
+    """Test that a write whose tables can't be determined clears the cache."""
+    cache = ResultCache(max_entries=10)
+    key = cache.make_key("SELECT * FROM `db`.`users`")
+    cache.set(key, _result(1), ttl=60, tags={("db", "users")})
+
+    cache.invalidate_statement("DELETE FROM users")
+
+    assert cache.get(key) is None
+
+
+def test_referenced_tables():
+    """Test extraction of the tables a statement reads."""
+    assert referenced_tables("SELECT * FROM `db`.`users` u JOIN db.orders o ON u.id = o.user_id") >= {
+        ("db", "users"), ("db", "orders")
+    }
+    # Unqualified names depend on the connection's default database
+    assert referenced_tables("SELECT * FROM users") is None
+    # Catalog reads describe other tables
+    assert referenced_tables("SELECT * FROM information_schema.TABLES") is None
+
+
+@pytest.mark.parametrize("sql,kind", [
+    ("SELECT * FROM `db`.`users` WHERE id = 1", "SELECT"),
+    ("SELECT status FROM `db`.`orders`", "SELECT"),
+    ("SHOW TABLES FROM `db`", "SHOW"),
+    ("SHOW CREATE TABLE `db`.`users`", "SHOW"),
+    ("DESCRIBE `db`.`users`", "READ"),
+])
+def test_is_cacheable(sql, kind):
+    """Test that plain reads may be cached."""
+    assert is_cacheable(sql, kind)
+
+
+@pytest.mark.parametrize("sql,kind", [
+    ("SELECT * FROM `db`.`users` INTO OUTFILE '/tmp/users.csv'", "SELECT"),
+    ("SELECT COUNT(*) INTO @total FROM `db`.`users`", "SELECT"),
+    ("SELECT @total", "SELECT"),
+    ("SELECT * FROM `db`.`users` WHERE id = 1 FOR UPDATE", "SELECT"),
+    ("SELECT * FROM `db`.`users` FOR SHARE", "SELECT"),
+    ("SELECT * FROM `db`.`users` LOCK IN SHARE MODE", "SELECT"),
+    ("SELECT GET_LOCK('job', 10)", "SELECT"),
+    ("SELECT RELEASE_LOCK('job')", "SELECT"),
+    ("SELECT SLEEP(1)", "SELECT"),
+    ("SELECT NOW()", "SELECT"),
+    ("SELECT * FROM `db`.`users` ORDER BY RAND() LIMIT 1", "SELECT"),
+    ("SELECT UUID()", "SELECT"),
+    ("SELECT CURRENT_TIMESTAMP", "SELECT"),
+    ("SHOW PROCESSLIST", "SHOW"),
+    ("SHOW FULL PROCESSLIST", "SHOW"),
+    ("SHOW GLOBAL STATUS", "SHOW"),
+    ("SHOW VARIABLES LIKE 'max_connections'", "SHOW"),
+    ("SHOW ENGINE INNODB STATUS", "SHOW"),
+])
+def test_is_not_cacheable(sql, kind):
+    """Test that statements with side effects or volatile results always run."""
+    assert not is_cacheable(sql, kind)